@@ -0,0 +1,31 @@
+"""
+JIT Compilation Helpers for Chronicles of Aethermoor
+Optional Numba acceleration for numeric hot paths
+"""
+
+try:
+    from numba import njit as _numba_njit
+    HAVE_NUMBA = True
+except ImportError:
+    _numba_njit = None
+    HAVE_NUMBA = False
+
+
+def maybe_njit(*args, **kwargs):
+    """
+    Compile a function with numba.njit when Numba is installed.
+    
+    Usable bare (@maybe_njit) or with options (@maybe_njit(fastmath=True)).
+    Compiled code is cached on disk by default. Without Numba the function
+    is returned unchanged, so decorated code must also be valid plain Python.
+    """
+    kwargs.setdefault('cache', True)
+    
+    def decorator(func):
+        if _numba_njit is None:
+            return func
+        return _numba_njit(**kwargs)(func)
+    
+    if len(args) == 1 and callable(args[0]):
+        return decorator(args[0])
+    return decorator
@@ -5,11 +5,20 @@ Manages game settings, display options, and gameplay parameters
 
 import json
 import os
-from typing import Dict, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Optional, Tuple
+from dataclasses import dataclass, asdict, fields, replace
 
+import pygame
 
-@dataclass
+from .event_manager import EventType, emit_event
+
+try:
+    import orjson  # Optional faster parser for config loading
+except ImportError:
+    orjson = None
+
+
+@dataclass(slots=True)
 class DisplayConfig:
     """Display and graphics configuration"""
     width: int = 1280
@@ -18,9 +27,10 @@ class DisplayConfig:
     vsync: bool = True
     fps_limit: int = 60
     ui_scale: float = 1.0
+    precise_frame_pacing: bool = False  # Spin the last millisecond of each frame
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioConfig:
     """Audio configuration"""
     master_volume: float = 1.0
@@ -29,7 +39,7 @@ class AudioConfig:
     voice_volume: float = 0.9
 
 
-@dataclass
+@dataclass(slots=True)
 class GameplayConfig:
     """Gameplay configuration"""
     difficulty: str = "normal"  # easy, normal, hard, expert
@@ -40,7 +50,7 @@ class GameplayConfig:
     show_tutorial_hints: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ControlsConfig:
     """Input controls configuration"""
     move_up: str = "w"
@@ -57,9 +67,24 @@ class ControlsConfig:
     quick_load: str = "f9"
 
 
+# Config file sections and the field names each section's dataclass accepts
+_SECTION_FIELDS: Tuple[Tuple[str, frozenset], ...] = tuple(
+    (section, frozenset(f.name for f in fields(cls)))
+    for section, cls in (
+        ('display', DisplayConfig),
+        ('audio', AudioConfig),
+        ('gameplay', GameplayConfig),
+        ('controls', ControlsConfig),
+    )
+)
+
+
 class Config:
     """Main configuration manager"""
     
+    # Parsed file contents shared across instances: path -> ((mtime_ns, size), data)
+    _parse_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+    
     def __init__(self, config_file: str = "config.json"):
         self.config_file = config_file
         self.display = DisplayConfig()
@@ -67,38 +92,86 @@ class Config:
         self.gameplay = GameplayConfig()
         self.controls = ControlsConfig()
         
+        # action -> pygame key code, built on first use
+        self._key_codes: Optional[Dict[str, int]] = None
+        
+        # Signature of the file contents last applied to this instance
+        self._loaded_signature: Optional[Tuple[int, int]] = None
+        
         self.load_config()
     
     def load_config(self) -> None:
         """Load configuration from file"""
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
-                
-                # Update configurations with loaded data
-                if 'display' in data:
-                    for key, value in data['display'].items():
-                        if hasattr(self.display, key):
-                            setattr(self.display, key, value)
-                
-                if 'audio' in data:
-                    for key, value in data['audio'].items():
-                        if hasattr(self.audio, key):
-                            setattr(self.audio, key, value)
-                
-                if 'gameplay' in data:
-                    for key, value in data['gameplay'].items():
-                        if hasattr(self.gameplay, key):
-                            setattr(self.gameplay, key, value)
+                data = self._read_config_file()
+            except (ValueError, IOError) as e:  # JSONDecodeError is a ValueError
+                cached = Config._parse_cache.get(self.config_file)
+                if cached is None:
+                    print(f"Error loading config: {e}. Using defaults.")
+                    return
                 
-                if 'controls' in data:
-                    for key, value in data['controls'].items():
-                        if hasattr(self.controls, key):
-                            setattr(self.controls, key, value)
-                            
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading config: {e}. Using defaults.")
+                # Serve the last good parse of this file rather than defaults
+                print(f"Error loading config: {e}. Using last loaded values.")
+                data = cached[1]
+            
+            self._apply_config_data(data)
+    
+    def _apply_config_data(self, data: Dict[str, Any]) -> None:
+        """Update configurations with loaded data"""
+        for section, field_names in _SECTION_FIELDS:
+            values = data.get(section)
+            if values:
+                updates = {k: v for k, v in values.items() if k in field_names}
+                setattr(self, section, replace(getattr(self, section), **updates))
+        
+        self._key_codes = None
+    
+    def revalidate(self) -> bool:
+        """
+        Reload the config file if it changed since this instance last read it.
+        
+        The current values keep being served if the file is missing or cannot
+        be parsed. Emits SETTINGS_CHANGED and returns True if any section changed.
+        """
+        try:
+            if self._file_signature() == self._loaded_signature:
+                return False
+            data = self._read_config_file()
+        except (ValueError, IOError):
+            return False
+        
+        previous = {section: getattr(self, section) for section, _ in _SECTION_FIELDS}
+        self._apply_config_data(data)
+        
+        changed = [section for section, old in previous.items() if getattr(self, section) != old]
+        if changed:
+            emit_event(EventType.SETTINGS_CHANGED, {'sections': changed}, source='config')
+        return bool(changed)
+    
+    def _file_signature(self) -> Tuple[int, int]:
+        """Get the (mtime_ns, size) pair used to validate cached parses"""
+        stat = os.stat(self.config_file)
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _read_config_file(self) -> Dict[str, Any]:
+        """Parse the config file, reusing the cached result if it is unchanged"""
+        signature = self._file_signature()
+        cached = Config._parse_cache.get(self.config_file)
+        if cached is not None and cached[0] == signature:
+            self._loaded_signature = signature
+            return cached[1]
+        
+        if orjson is not None:
+            with open(self.config_file, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(self.config_file, 'r') as f:
+                data = json.load(f)
+        
+        Config._parse_cache[self.config_file] = (signature, data)
+        self._loaded_signature = signature
+        return data
     
     def save_config(self) -> None:
         """Save configuration to file"""
@@ -112,6 +185,10 @@ class Config:
             
             with open(self.config_file, 'w') as f:
                 json.dump(config_data, f, indent=4)
+            
+            # Keep the parse cache in step with what was just written
+            self._loaded_signature = self._file_signature()
+            Config._parse_cache[self.config_file] = (self._loaded_signature, config_data)
                 
         except IOError as e:
             print(f"Error saving config: {e}")
@@ -132,4 +209,21 @@ class Config:
     def set_key_binding(self, action: str, key: str) -> None:
         """Set key binding for an action"""
         if hasattr(self.controls, action):
-            setattr(self.controls, action, key)
\ No newline at end of file
+            setattr(self.controls, action, key)
+            self._key_codes = None
+    
+    def get_key_code(self, action: str) -> Optional[int]:
+        """Get the pygame key code bound to an action"""
+        if self._key_codes is None:
+            self._key_codes = self._build_key_codes()
+        return self._key_codes.get(action)
+    
+    def _build_key_codes(self) -> Dict[str, int]:
+        """Resolve every control binding to its pygame key code"""
+        key_codes = {}
+        for field in fields(ControlsConfig):
+            try:
+                key_codes[field.name] = pygame.key.key_code(getattr(self.controls, field.name))
+            except ValueError:
+                pass  # Unknown key name; leave the action unbound
+        return key_codes
\ No newline at end of file
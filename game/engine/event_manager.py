@@ -3,13 +3,19 @@ Event Management System for Chronicles of Aethermoor
 Implements observer pattern for game event handling
 """
 
-from typing import Dict, List, Callable, Any, Optional
+from typing import Dict, List, Callable, Any, Optional, Sequence, Tuple
 from enum import Enum
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import defaultdict, deque
+from itertools import islice
+import bisect
+import logging
 import weakref
 import time
 
+# Child of the game logger, so listener errors reach its file and console handlers
+_log = logging.getLogger("AethermoorRPG.events")
+
 
 class EventType(Enum):
     """Enumeration of all possible game events"""
@@ -37,6 +43,8 @@ class EventType(Enum):
     
     # World events
     DAY_NIGHT_CHANGED = "day_night_changed"
+    TIME_ADVANCED = "time_advanced"
+    TIME_JUMPED = "time_jumped"
     WEATHER_CHANGED = "weather_changed"
     LOCATION_ENTERED = "location_entered"
     LOCATION_EXITED = "location_exited"
@@ -64,7 +72,15 @@ class EventType(Enum):
     SETTINGS_CHANGED = "settings_changed"
 
 
-@dataclass
+# Stamp each event type with a dense index for addressing the listener
+# dispatch tables. Reading it is a plain attribute load, whereas using the
+# member as a dict key goes through Enum.__hash__, which is Python-level.
+for _index, _event_type in enumerate(EventType):
+    _event_type.index = _index
+del _index, _event_type
+
+
+@dataclass(slots=True)
 class GameEvent:
     """Represents a game event with associated data"""
     event_type: EventType
@@ -77,9 +93,36 @@ class GameEvent:
             self.timestamp = time.time()
 
 
+class _PooledEvent(GameEvent):
+    """GameEvent that EventManager may recycle once it leaves the history"""
+    
+    __slots__ = ('recyclable',)
+
+
+# High-frequency event types whose GameEvent objects are pooled. A pooled
+# event is only reused if it reached no listener or callback, since anything
+# that received it may keep it; get_event_history hands out copies.
+_HOT_EVENTS = frozenset({
+    EventType.PLAYER_MOVED,
+    EventType.ATTACK_PERFORMED,
+    EventType.DAMAGE_DEALT,
+    EventType.STATUS_EFFECT_APPLIED,
+})
+_POOLED_BY_INDEX = tuple(t in _HOT_EVENTS for t in EventType)
+
+
+def _snapshot_event(event: GameEvent) -> GameEvent:
+    """Copy a pooled event so callers never see it recycled; others are returned as is"""
+    if type(event) is _PooledEvent:
+        return GameEvent(event.event_type, event.data, event.timestamp, event.source)
+    return event
+
+
 class EventListener:
     """Base class for event listeners"""
     
+    __slots__ = ('priority', 'enabled', '__weakref__')
+    
     def __init__(self, priority: int = 0):
         self.priority = priority
         self.enabled = True
@@ -95,63 +138,132 @@ class EventListener:
         return []
 
 
+class _CallbackListener(EventListener):
+    """Listener that forwards events to a plain callback"""
+    
+    __slots__ = ('callback',)
+    
+    def __init__(self, callback: Callable[[GameEvent], bool], priority: int = 0):
+        super().__init__(priority)
+        self.callback = callback
+    
+    def handle_event(self, event: GameEvent) -> bool:
+        return self.callback(event)
+
+
 class EventManager:
     """Central event management system"""
     
-    _instance: Optional['EventManager'] = None
-    
     def __new__(cls) -> 'EventManager':
-        """Singleton pattern implementation"""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-    
-    def __init__(self):
-        if hasattr(self, '_initialized'):
-            return
-            
-        self._listeners: Dict[EventType, List[weakref.ref]] = defaultdict(list)
-        self._global_listeners: List[weakref.ref] = []
-        self._event_queue: List[GameEvent] = []
+        """Return the shared instance built at module import"""
+        return _EVENT_MANAGER
+    
+    def _setup(self) -> None:
+        """Initialize manager state (runs once, for the module instance)"""
+        # Listeners live in weak-value buckets keyed by subscription number,
+        # so collected listeners drop out without a cleanup callback. The
+        # parallel order lists hold (-priority, seq) keys sorted via bisect;
+        # they are replaced rather than mutated, so dispatch never copies them.
+        # Both tables are indexed by event_type.index.
+        self._listeners: List[weakref.WeakValueDictionary] = [
+            weakref.WeakValueDictionary() for _ in EventType
+        ]
+        self._listener_order: List[List[Tuple[int, int]]] = [[] for _ in EventType]
+        self._global_listeners: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self._global_order: List[Tuple[int, int]] = []
+        self._has_globals = False
+        # Bare callables, held strongly and run after the listeners of a type
+        self._callbacks: List[List[Tuple[Tuple[int, int], Callable[[GameEvent], bool]]]] = [
+            [] for _ in EventType
+        ]
+        self._seq = 0
+        self._event_queue: deque[GameEvent] = deque()
         self._processing = False
-        self._event_history: List[GameEvent] = []
+        self._frame_time = 0.0  # Timestamp shared by events emitted while processing
         self._max_history = 1000  # Keep last 1000 events
-        self._initialized = True
+        self._event_history: deque[GameEvent] = deque(maxlen=self._max_history)
+        self._event_pool: List[_PooledEvent] = [
+            _PooledEvent(EventType.PLAYER_MOVED, None, 0.0) for _ in range(256)
+        ]
     
     def subscribe(self, event_type: EventType, listener: EventListener) -> None:
         """Subscribe a listener to a specific event type"""
-        listener_ref = weakref.ref(listener, self._cleanup_listener)
-        self._listeners[event_type].append(listener_ref)
+        index = event_type.index
+        key = self._next_key(listener.priority)
+        bucket = self._listeners[index]
+        bucket[key[1]] = listener
         
-        # Sort by priority (higher priority first)
-        self._listeners[event_type].sort(
-            key=lambda ref: ref().priority if ref() else -999, 
-            reverse=True
-        )
+        # Insert in priority order (higher priority first, FIFO within a tier)
+        self._listener_order[index] = self._insert_key(self._listener_order[index], bucket, key)
     
     def subscribe_global(self, listener: EventListener) -> None:
         """Subscribe a listener to all events"""
-        listener_ref = weakref.ref(listener, self._cleanup_global_listener)
-        self._global_listeners.append(listener_ref)
+        key = self._next_key(listener.priority)
+        self._global_listeners[key[1]] = listener
+        self._has_globals = True
         
-        # Sort by priority
-        self._global_listeners.sort(
-            key=lambda ref: ref().priority if ref() else -999,
-            reverse=True
-        )
+        # Insert in priority order
+        self._global_order = self._insert_key(self._global_order, self._global_listeners, key)
+    
+    def _next_key(self, priority: int) -> Tuple[int, int]:
+        """Build a unique sort key so listener lists never need re-sorting"""
+        self._seq += 1
+        return (-priority, self._seq)
+    
+    @staticmethod
+    def _insert_key(order: List[Tuple[int, int]], bucket: weakref.WeakValueDictionary,
+                    key: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Return a new order list with key inserted, minus collected listeners"""
+        if len(order) >= len(bucket):
+            order = [k for k in order if k[1] in bucket]
+        else:
+            order = order[:]
+        bisect.insort(order, key)
+        return order
+    
+    @staticmethod
+    def _remove_listener(order: List[Tuple[int, int]], bucket: weakref.WeakValueDictionary,
+                         listener: EventListener) -> List[Tuple[int, int]]:
+        """Remove a listener from a bucket and return the pruned order list"""
+        for seq, registered in list(bucket.items()):
+            if registered is listener:
+                del bucket[seq]
+        return [k for k in order if k[1] in bucket]
     
     def unsubscribe(self, event_type: EventType, listener: EventListener) -> None:
         """Unsubscribe a listener from a specific event type"""
-        self._listeners[event_type] = [
-            ref for ref in self._listeners[event_type] 
-            if ref() is not None and ref() is not listener
-        ]
+        index = event_type.index
+        self._listener_order[index] = self._remove_listener(
+            self._listener_order[index], self._listeners[index], listener
+        )
     
     def unsubscribe_global(self, listener: EventListener) -> None:
         """Unsubscribe a listener from all events"""
-        self._global_listeners = [
-            ref for ref in self._global_listeners
-            if ref() is not None and ref() is not listener
+        self._global_order = self._remove_listener(
+            self._global_order, self._global_listeners, listener
+        )
+        self._has_globals = bool(self._global_order)
+    
+    def subscribe_callback(self, event_type: EventType, callback: Callable[[GameEvent], bool],
+                           priority: int = 0) -> None:
+        """
+        Subscribe a plain callable to a specific event type.
+        
+        Unlike listeners, callbacks are held strongly and are called directly,
+        without a weakref dereference or enabled check. They run after the
+        EventListener subscribers of the same type, ordered by priority.
+        """
+        index = event_type.index
+        entries = self._callbacks[index][:]
+        bisect.insort(entries, (self._next_key(priority), callback))
+        self._callbacks[index] = entries
+    
+    def unsubscribe_callback(self, event_type: EventType,
+                             callback: Callable[[GameEvent], bool]) -> None:
+        """Unsubscribe a callable from a specific event type"""
+        index = event_type.index
+        self._callbacks[index] = [
+            entry for entry in self._callbacks[index] if entry[1] is not callback
         ]
     
     def emit(self, event_type: EventType, data: Dict[str, Any] = None, 
@@ -159,13 +271,28 @@ class EventManager:
         """Emit an event"""
         if data is None:
             data = {}
-            
-        event = GameEvent(
-            event_type=event_type,
-            data=data,
-            timestamp=time.time(),
-            source=source
-        )
+        
+        # Events emitted by listeners during process_events reuse the frame's
+        # timestamp instead of reading the clock again
+        timestamp = self._frame_time if self._processing else time.time()
+        
+        if _POOLED_BY_INDEX[event_type.index]:
+            if self._event_pool:
+                event = self._event_pool.pop()
+                event.event_type = event_type
+                event.data = data
+                event.timestamp = timestamp
+                event.source = source
+            else:
+                event = _PooledEvent(event_type, data, timestamp, source)
+            event.recyclable = True
+        else:
+            event = GameEvent(
+                event_type=event_type,
+                data=data,
+                timestamp=timestamp,
+                source=source
+            )
         
         if immediate:
             self._process_event(event)
@@ -178,65 +305,119 @@ class EventManager:
         self.emit(event_type, data, source, immediate=True)
     
     def process_events(self) -> None:
-        """Process all queued events"""
+        """
+        Process all queued events.
+        
+        Queued events are grouped by type and dispatched one batch per type,
+        so each type's listener lists are fetched once per batch. Events of
+        the same type keep their emission order; batches run in the order
+        each type was first queued.
+        """
         if self._processing:
             return  # Prevent recursive processing
         
         self._processing = True
+        self._frame_time = time.time()
         
         try:
             while self._event_queue:
-                event = self._event_queue.pop(0)
-                self._process_event(event)
+                batches: Dict[int, List[GameEvent]] = defaultdict(list)
+                while self._event_queue:
+                    event = self._event_queue.popleft()
+                    batches[event.event_type.index].append(event)
+                
+                for index, events in batches.items():
+                    self._process_batch(index, events)
         finally:
             self._processing = False
     
     def _process_event(self, event: GameEvent) -> None:
         """Process a single event"""
-        # Add to history
-        self._event_history.append(event)
-        if len(self._event_history) > self._max_history:
-            self._event_history.pop(0)
-        
-        consumed = False
-        
-        # Process global listeners first
-        for listener_ref in self._global_listeners[:]:  # Copy to avoid modification during iteration
-            listener = listener_ref()
-            if listener is None:
-                continue
-                
-            if listener.enabled:
-                try:
-                    if listener.handle_event(event):
-                        consumed = True
-                        break
-                except Exception as e:
-                    print(f"Error in global event listener: {e}")
+        self._process_batch(event.event_type.index, (event,))
+    
+    def _process_batch(self, index: int, events: Sequence[GameEvent]) -> None:
+        """Process a batch of events that share the type with the given index"""
+        global_listeners = self._global_listeners
+        bucket = self._listeners[index]
+        listener_order = self._listener_order
+        callback_table = self._callbacks
+        history = self._event_history
+        stale = stale_globals = False
         
-        # Process specific event listeners if not consumed
-        if not consumed and event.event_type in self._listeners:
-            for listener_ref in self._listeners[event.event_type][:]:
-                listener = listener_ref()
-                if listener is None:
-                    continue
-                    
-                if listener.enabled:
+        for event in events:
+            # Re-read the copy-on-write lists per event, so a listener
+            # subscribed or removed by an earlier event in the batch applies
+            # to the rest of it
+            has_globals = self._has_globals
+            global_order = self._global_order
+            order = listener_order[index]
+            callbacks = callback_table[index]
+            
+            # Add to history (deque maxlen drops the oldest entry), returning
+            # a pooled event nobody received to the pool as it is evicted
+            if len(history) == self._max_history:
+                evicted = history[0]
+                if type(evicted) is _PooledEvent and evicted.recyclable:
+                    evicted.data = None
+                    self._event_pool.append(evicted)
+            history.append(event)
+            
+            # Listeners may keep the event, so it must never be recycled
+            if type(event) is _PooledEvent and (has_globals or order or callbacks):
+                event.recyclable = False
+            
+            consumed = False
+            
+            # Process global listeners first
+            if has_globals:
+                for _, seq in global_order:
+                    listener = global_listeners.get(seq)
+                    if listener is None:
+                        stale_globals = True
+                        continue
+                        
+                    if listener.enabled:
+                        try:
+                            if listener.handle_event(event):
+                                consumed = True
+                                break
+                        except Exception:
+                            _log.exception("Error in global event listener for %s", event.event_type)
+            
+            # Process specific event listeners if not consumed
+            if not consumed and order:
+                for _, seq in order:
+                    listener = bucket.get(seq)
+                    if listener is None:
+                        stale = True
+                        continue
+                        
+                    if listener.enabled:
+                        try:
+                            if listener.handle_event(event):
+                                consumed = True
+                                break
+                        except Exception:
+                            _log.exception("Error in event listener for %s", event.event_type)
+            
+            # Process direct callbacks if still not consumed
+            if not consumed and callbacks:
+                for _, callback in callbacks:
                     try:
-                        if listener.handle_event(event):
-                            consumed = True
+                        if callback(event):
                             break
-                    except Exception as e:
-                        print(f"Error in event listener for {event.event_type}: {e}")
-    
-    def _cleanup_listener(self, ref) -> None:
-        """Clean up dead listener references"""
-        for event_type, listeners in self._listeners.items():
-            self._listeners[event_type] = [l for l in listeners if l is not ref]
-    
-    def _cleanup_global_listener(self, ref) -> None:
-        """Clean up dead global listener references"""
-        self._global_listeners = [l for l in self._global_listeners if l is not ref]
+                    except Exception:
+                        _log.exception("Error in event callback for %s", event.event_type)
+        
+        # Drop keys of listeners collected without unsubscribing, so dead
+        # entries do not pile up in order lists that rarely see a subscribe
+        if stale:
+            self._listener_order[index] = [
+                k for k in self._listener_order[index] if k[1] in bucket
+            ]
+        if stale_globals:
+            self._global_order = [k for k in self._global_order if k[1] in global_listeners]
+            self._has_globals = bool(self._global_order)
     
     def clear_queue(self) -> None:
         """Clear all queued events"""
@@ -244,26 +425,38 @@ class EventManager:
     
     def get_event_history(self, event_type: Optional[EventType] = None, 
                          limit: int = 100) -> List[GameEvent]:
-        """Get recent event history"""
+        """Get recent event history (pooled events are returned as copies)"""
         if event_type is None:
-            return self._event_history[-limit:]
+            start = max(0, len(self._event_history) - limit)
+            return list(map(_snapshot_event, islice(self._event_history, start, None)))
         else:
-            filtered = [e for e in self._event_history if e.event_type == event_type]
-            return filtered[-limit:]
+            filtered = [e for e in self._event_history if e.event_type is event_type]
+            return list(map(_snapshot_event, filtered[-limit:]))
     
     def get_listener_count(self, event_type: EventType) -> int:
         """Get number of listeners for an event type"""
-        return len([ref for ref in self._listeners[event_type] if ref() is not None])
+        index = event_type.index
+        return len(self._listeners[index]) + len(self._callbacks[index])
+    
+    def has_listeners(self, event_type: EventType) -> bool:
+        """Check whether emitting this event type would reach any listener"""
+        index = event_type.index
+        return self._has_globals or bool(self._listeners[index]) or bool(self._callbacks[index])
     
     def get_global_listener_count(self) -> int:
         """Get number of global listeners"""
-        return len([ref for ref in self._global_listeners if ref() is not None])
+        return len(self._global_listeners)
+
+
+# Shared instance; EventManager() and get_event_manager() both return it
+_EVENT_MANAGER: EventManager = object.__new__(EventManager)
+_EVENT_MANAGER._setup()
 
 
 # Convenience functions
 def get_event_manager() -> EventManager:
     """Get the singleton event manager instance"""
-    return EventManager()
+    return _EVENT_MANAGER
 
 
 def emit_event(event_type: EventType, data: Dict[str, Any] = None, 
@@ -275,14 +468,6 @@ def emit_event(event_type: EventType, data: Dict[str, Any] = None,
 def subscribe_to_event(event_type: EventType, callback: Callable[[GameEvent], bool],
                       priority: int = 0) -> EventListener:
     """Convenience function to subscribe to an event with a callback"""
-    class CallbackListener(EventListener):
-        def __init__(self, cb, prio):
-            super().__init__(prio)
-            self.callback = cb
-        
-        def handle_event(self, event: GameEvent) -> bool:
-            return self.callback(event)
-    
-    listener = CallbackListener(callback, priority)
+    listener = _CallbackListener(callback, priority)
     get_event_manager().subscribe(event_type, listener)
     return listener
\ No newline at end of file
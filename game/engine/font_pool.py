@@ -0,0 +1,26 @@
+"""
+Font Pool for Chronicles of Aethermoor
+Shares loaded pygame fonts so each face/size is opened only once
+"""
+
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+
+_CACHE: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+
+
+def get(size: int, path: Optional[str] = None) -> pygame.font.Font:
+    """Get the font for a file and point size, loading it on first use"""
+    key = (path, size)
+    font = _CACHE.get(key)
+    if font is None:
+        font = pygame.font.Font(path, size)
+        _CACHE[key] = font
+    return font
+
+
+def clear() -> None:
+    """Drop all cached fonts (required after pygame.font.quit())"""
+    _CACHE.clear()
@@ -6,18 +6,72 @@ Coordinates all game systems and manages the main game loop
 import pygame
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
 
+from . import font_pool
 from .config import Config
 from .logger import Logger
 from .event_manager import EventManager, EventType
-from .state_manager import StateManager, StateType
+from .state_manager import GameState, StateManager, StateType
 from .time_manager import TimeManager
 
 
+# Event types let through to the Python-side queue; all others are dropped by SDL
+_ALLOWED_EVENT_TYPES = [
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.WINDOWRESIZED,
+    pygame.WINDOWFOCUSGAINED,
+    pygame.WINDOWFOCUSLOST,
+    # Window uncovered or brought back; static states must be re-presented
+    pygame.WINDOWEXPOSED,
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWSHOWN,
+]
+
+# States whose visuals only change in response to input; their last frame is
+# reused until an event arrives or the active state changes
+_STATIC_STATES = frozenset({
+    StateType.SPLASH_SCREEN,
+    StateType.MAIN_MENU,
+    StateType.PAUSE_MENU,
+})
+
+# NOTE: Surfaces kept across frames must be converted to the display format
+# (convert()/convert_alpha()) once the display exists, otherwise every blit
+# pays for a per-pixel format conversion.
+_ICON: Optional[pygame.Surface] = None
+
+
+def _make_icon() -> pygame.Surface:
+    """Build the placeholder window icon once, in display format"""
+    global _ICON
+    if _ICON is None:
+        icon = pygame.Surface((32, 32))
+        icon.fill((100, 50, 200))  # Purple color
+        _ICON = icon.convert()
+    return _ICON
+
+
 class GameEngine:
     """Main game engine that coordinates all systems"""
     
+    __slots__ = (
+        'config', 'logger', 'running',
+        'event_manager', 'state_manager', 'time_manager', '_systems',
+        'screen',
+        'frame_count', 'total_time', 'last_fps_update', 'current_fps',
+        'delta_time', 'last_frame_time', 'sim_dt', 'max_frame_time',
+        '_dirty', '_last_rendered_state',
+        'show_debug', '_debug_font', '_debug_text_cache',
+        '_global_key_handlers', '_io_pool',
+    )
+    
     def __init__(self, config: Config, logger: Logger):
         """Initialize the game engine"""
         self.config = config
@@ -29,9 +83,17 @@ class GameEngine:
         self.state_manager = StateManager()
         self.time_manager = TimeManager()
         
+        # Lookup table for get_system
+        self._systems: Dict[str, Any] = {
+            'event_manager': self.event_manager,
+            'state_manager': self.state_manager,
+            'time_manager': self.time_manager,
+            'config': self.config,
+            'logger': self.logger
+        }
+        
         # Pygame systems
         self.screen: Optional[pygame.Surface] = None
-        self.clock = pygame.time.Clock()
         
         # Performance tracking
         self.frame_count = 0
@@ -43,6 +105,27 @@ class GameEngine:
         self.delta_time = 0.0
         self.last_frame_time = 0.0
         
+        # Fixed-timestep simulation: systems update in steps of sim_dt
+        # regardless of render rate; leftover frame time carries over
+        self.sim_dt = 1.0 / 60.0
+        self.max_frame_time = 0.25  # Cap per-frame catch-up to avoid a spiral of updates
+        
+        # Redraw tracking for static states
+        self._dirty = True
+        self._last_rendered_state = None
+        
+        # Debug overlay toggled with F12; font and rendered text created on first use
+        self.show_debug = False
+        self._debug_font: Optional[pygame.font.Font] = None
+        self._debug_text_cache: Dict[str, pygame.Surface] = {}
+        
+        # Global key bindings handled before states see the event
+        self._global_key_handlers: Dict[int, Any] = {}
+        self._bind_global_keys()
+        
+        # Background worker for file output (screenshots) so encoding never blocks a frame
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='game-io')
+        
         self.logger.info("Game Engine initialized")
     
     def initialize(self) -> bool:
@@ -73,24 +156,36 @@ class GameEngine:
     def _initialize_display(self) -> bool:
         """Initialize the display system"""
         try:
-            # Set up display
-            display_flags = 0
+            # Set up display (SCALED gives a renderer-backed window that can vsync)
+            display_flags = pygame.DOUBLEBUF | pygame.SCALED
             if self.config.display.fullscreen:
-                display_flags |= pygame.FULLSCREEN
-            if self.config.display.vsync:
-                display_flags |= pygame.DOUBLEBUF
+                display_flags |= pygame.FULLSCREEN | pygame.HWSURFACE
             
-            self.screen = pygame.display.set_mode(
-                self.config.get_resolution(),
-                display_flags
-            )
+            try:
+                self.screen = pygame.display.set_mode(
+                    self.config.get_resolution(),
+                    display_flags,
+                    vsync=1 if self.config.display.vsync else 0
+                )
+            except pygame.error as e:
+                # Not every driver supports vsync; fall back to an unsynced display
+                if not self.config.display.vsync:
+                    raise
+                self.logger.warning(f"VSync unavailable, continuing without it: {e}")
+                self.screen = pygame.display.set_mode(
+                    self.config.get_resolution(),
+                    display_flags
+                )
             
             pygame.display.set_caption("Chronicles of Aethermoor")
             
-            # Set up icon (placeholder)
-            icon = pygame.Surface((32, 32))
-            icon.fill((100, 50, 200))  # Purple color
-            pygame.display.set_icon(icon)
+            # Text rendering is required by every state; fail here rather than on state entry
+            pygame.font.init()
+            if not pygame.font.get_init():
+                raise RuntimeError("pygame.font failed to initialize")
+            
+            # Set up icon (placeholder); built after set_mode so it can be converted
+            pygame.display.set_icon(_make_icon())
             
             self.logger.info(f"Display initialized: {self.config.get_resolution()}")
             return True
@@ -136,62 +231,87 @@ class GameEngine:
     
     def _create_placeholder_states(self) -> None:
         """Create placeholder states for development"""
-        from .state_manager import GameState
+        config = self.config
         
         class PlaceholderState(GameState):
+            __slots__ = ('color', 'font', '_title_surf', '_inst_surf',
+                         '_title_rect', '_inst_rect', '_layout_size')
+            
+            INSTRUCTIONS = {
+                StateType.SPLASH_SCREEN: "Press SPACE to continue",
+                StateType.MAIN_MENU: "Press ENTER to start game",
+            }
+            
+            # (state, key) -> state manager action
+            KEY_ACTIONS = {
+                (StateType.SPLASH_SCREEN, pygame.K_SPACE): lambda sm: sm.change_state(StateType.MAIN_MENU),
+                (StateType.MAIN_MENU, pygame.K_RETURN): lambda sm: sm.change_state(StateType.GAMEPLAY),
+            }
+            
+            # state -> action for the configured pause binding
+            PAUSE_ACTIONS = {
+                StateType.GAMEPLAY: lambda sm: sm.push_state(StateType.PAUSE_MENU),
+                StateType.PAUSE_MENU: lambda sm: sm.pop_state(),
+            }
+            
             def __init__(self, state_type, state_manager, color=(100, 100, 100)):
                 super().__init__(state_type, state_manager)
                 self.color = color
                 self.font = None
+                
+                # Text rendered once per enter, positioned once per screen size
+                self._title_surf = None
+                self._inst_surf = None
+                self._title_rect = None
+                self._inst_rect = None
+                self._layout_size = None
             
-            def enter(self, previous_state=None, data=None):
-                super().enter(previous_state, data)
-                try:
-                    self.font = pygame.font.Font(None, 36)
-                except:
-                    self.font = None
-            
-            def exit(self, next_state=None):
-                super().exit(next_state)
+            def on_enter(self, previous_state, data):
+                self.font = font_pool.get(36)  # Font module is initialized with the display
+                
+                title = self.state_type.value.replace('_', ' ').title()
+                self._title_surf = self.font.render(title, True, (255, 255, 255)).convert_alpha()
+                instruction = self.INSTRUCTIONS.get(self.state_type)
+                self._inst_surf = None
+                if instruction:
+                    self._inst_surf = self.font.render(
+                        instruction, True, (200, 200, 200)
+                    ).convert_alpha()
+                self._layout_size = None
             
             def update(self, delta_time):
                 pass
             
             def render(self, screen):
                 screen.fill(self.color)
-                if self.font:
-                    text = self.font.render(
-                        f"{self.state_type.value.replace('_', ' ').title()}", 
-                        True, (255, 255, 255)
-                    )
-                    text_rect = text.get_rect(center=screen.get_rect().center)
-                    screen.blit(text, text_rect)
-                    
-                    # Instructions
-                    if self.state_type == StateType.SPLASH_SCREEN:
-                        instruction = self.font.render("Press SPACE to continue", True, (200, 200, 200))
-                        inst_rect = instruction.get_rect(center=(screen.get_width()//2, screen.get_height()//2 + 50))
-                        screen.blit(instruction, inst_rect)
-                    elif self.state_type == StateType.MAIN_MENU:
-                        instruction = self.font.render("Press ENTER to start game", True, (200, 200, 200))
-                        inst_rect = instruction.get_rect(center=(screen.get_width()//2, screen.get_height()//2 + 50))
-                        screen.blit(instruction, inst_rect)
+                if self._title_surf is None:
+                    return
+                
+                size = screen.get_size()
+                if size != self._layout_size:
+                    self._layout_size = size
+                    self._title_rect = self._title_surf.get_rect(center=screen.get_rect().center)
+                    if self._inst_surf is not None:
+                        self._inst_rect = self._inst_surf.get_rect(
+                            center=(size[0] // 2, size[1] // 2 + 50)
+                        )
+                
+                screen.blit(self._title_surf, self._title_rect)
+                
+                # Instructions
+                if self._inst_surf is not None:
+                    screen.blit(self._inst_surf, self._inst_rect)
             
             def handle_event(self, event):
-                if event.type == pygame.KEYDOWN:
-                    if self.state_type == StateType.SPLASH_SCREEN and event.key == pygame.K_SPACE:
-                        self.state_manager.change_state(StateType.MAIN_MENU)
-                        return True
-                    elif self.state_type == StateType.MAIN_MENU and event.key == pygame.K_RETURN:
-                        self.state_manager.change_state(StateType.GAMEPLAY)
-                        return True
-                    elif self.state_type == StateType.GAMEPLAY and event.key == pygame.K_ESCAPE:
-                        self.state_manager.push_state(StateType.PAUSE_MENU)
-                        return True
-                    elif self.state_type == StateType.PAUSE_MENU and event.key == pygame.K_ESCAPE:
-                        self.state_manager.pop_state()
-                        return True
-                return False
+                if event.type != pygame.KEYDOWN:
+                    return False
+                action = self.KEY_ACTIONS.get((self.state_type, event.key))
+                if action is None and event.key == config.get_key_code('pause'):
+                    action = self.PAUSE_ACTIONS.get(self.state_type)
+                if action is None:
+                    return False
+                action(self.state_manager)
+                return True
         
         # Create placeholder states with different colors
         self.state_manager.register_state(
@@ -213,6 +333,10 @@ class GameEngine:
             # Set key repeat
             pygame.key.set_repeat(250, 50)  # Initial delay, repeat interval
             
+            # Only queue event types the engine and states handle
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed(_ALLOWED_EVENT_TYPES)
+            
             self.logger.info("Input system initialized")
             return True
             
@@ -227,34 +351,64 @@ class GameEngine:
             return
         
         self.running = True
-        self.last_frame_time = time.time()
+        self.last_frame_time = time.perf_counter()
         self.last_fps_update = self.last_frame_time
         
         self.logger.info("Starting main game loop")
         
+        # Bind per-frame lookups to locals for the hot loop
+        perf_counter = time.perf_counter
+        sleep = time.sleep
+        handle_events = self._handle_events
+        update = self._update
+        render = self._render
+        update_performance_metrics = self._update_performance_metrics
+        sim_dt = self.sim_dt
+        max_frame_time = self.max_frame_time
+        last_frame_time = self.last_frame_time
+        accumulator = 0.0
+        
         try:
             while self.running:
-                current_time = time.time()
-                self.delta_time = current_time - self.last_frame_time
-                self.last_frame_time = current_time
+                current_time = perf_counter()
                 
                 # Cap delta time to prevent large jumps
-                self.delta_time = min(self.delta_time, 1.0 / 20.0)  # Max 20 FPS minimum
+                delta_time = min(current_time - last_frame_time, max_frame_time)
+                last_frame_time = current_time
+                self.delta_time = delta_time
+                self.last_frame_time = current_time
+                accumulator += delta_time
                 
                 # Handle events
-                self._handle_events()
+                handle_events()
                 
-                # Update systems
-                self._update(self.delta_time)
+                # Update systems in fixed steps
+                while accumulator >= sim_dt:
+                    update(sim_dt)
+                    accumulator -= sim_dt
                 
                 # Render
-                self._render()
+                render()
                 
                 # Update performance metrics
-                self._update_performance_metrics(current_time)
+                update_performance_metrics(current_time)
                 
-                # Control frame rate
-                self.clock.tick(self.config.display.fps_limit)
+                # Control frame rate: sleep out the remaining frame time
+                # (time.sleep uses a high-resolution timer on Windows and
+                # Linux). With precise_frame_pacing, wake a millisecond early
+                # and spin the rest, trading CPU for an exact wake-up
+                display = self.config.display
+                fps_limit = display.fps_limit
+                if fps_limit > 0:
+                    frame_deadline = current_time + 1.0 / fps_limit
+                    remaining = frame_deadline - perf_counter()
+                    if display.precise_frame_pacing:
+                        if remaining > 0.002:
+                            sleep(remaining - 0.001)
+                        while perf_counter() < frame_deadline:
+                            pass
+                    elif remaining > 0:
+                        sleep(remaining)
                 
         except KeyboardInterrupt:
             self.logger.info("Game interrupted by user")
@@ -266,30 +420,31 @@ class GameEngine:
     
     def _handle_events(self) -> None:
         """Handle pygame events"""
-        for event in pygame.event.get():
+        key_handlers = self._global_key_handlers
+        events = pygame.event.get()
+        if events:
+            self._dirty = True  # Input or a window expose/restore invalidates the frame
+        
+        for event in events:
+            event_type = event.type
+            
             # Check for quit events
-            if event.type == pygame.QUIT:
+            if event_type == pygame.QUIT:
                 self.shutdown()
                 return
             
             # Handle global key events
-            if event.type == pygame.KEYDOWN:
-                # Quick save/load
-                if event.key == pygame.K_F5:
-                    self._handle_quick_save()
-                elif event.key == pygame.K_F9:
-                    self._handle_quick_load()
-                # Debug features
-                elif event.key == pygame.K_F12:
-                    self._toggle_debug_info()
-                # Screenshot
-                elif event.key == pygame.K_F10:
-                    self._take_screenshot()
+            if event_type == pygame.KEYDOWN:
+                handler = key_handlers.get(event.key)
+                if handler is not None:
+                    handler()
+            
+            # Pick up config.json edits made while the window was in the background
+            elif event_type == pygame.WINDOWFOCUSGAINED:
+                self._reload_settings()
             
             # Pass event to state manager
-            if not self.state_manager.handle_event(event):
-                # Event not consumed by states, handle globally if needed
-                pass
+            self.state_manager.handle_event(event)
     
     def _update(self, delta_time: float) -> None:
         """Update all game systems"""
@@ -303,6 +458,14 @@ class GameEngine:
         if not self.screen:
             return
         
+        # Keep the previous frame if a static state is showing and nothing changed
+        current_state = self.state_manager.get_current_state()
+        if (not self._dirty and not self.show_debug
+                and current_state is self._last_rendered_state
+                and current_state is not None
+                and current_state.state_type in _STATIC_STATES):
+            return
+        
         # Clear screen
         self.screen.fill((0, 0, 0))
         
@@ -314,58 +477,98 @@ class GameEngine:
         
         # Update display
         pygame.display.flip()
+        self._dirty = False
+        self._last_rendered_state = current_state
     
     def _render_debug_info(self) -> None:
         """Render debug information overlay"""
-        if not hasattr(self, 'show_debug') or not self.show_debug:
+        if not self.show_debug:
             return
         
         try:
-            font = pygame.font.Font(None, 24)
+            if self._debug_font is None:
+                self._debug_font = font_pool.get(24)
             y_offset = 10
             line_height = 25
             
             # FPS
-            fps_text = font.render(f"FPS: {self.current_fps:.1f}", True, (255, 255, 0))
-            self.screen.blit(fps_text, (10, y_offset))
+            self._blit_debug_line("FPS: ", f"{self.current_fps:.1f}", y_offset)
             y_offset += line_height
             
             # Game time
             game_time = self.time_manager.get_time()
-            time_text = font.render(f"Time: {game_time}", True, (255, 255, 0))
-            self.screen.blit(time_text, (10, y_offset))
+            self._blit_debug_line("Time: ", str(game_time), y_offset)
             y_offset += line_height
             
             # Current state
             current_state = self.state_manager.get_current_state()
-            state_text = font.render(
-                f"State: {current_state.state_type.value if current_state else 'None'}", 
-                True, (255, 255, 0)
+            self._blit_debug_line(
+                "State: ", current_state.state_type.value if current_state else 'None', y_offset
             )
-            self.screen.blit(state_text, (10, y_offset))
             y_offset += line_height
             
             # Weather
             weather = self.time_manager.get_weather()
-            weather_text = font.render(
-                f"Weather: {weather.weather_type.value} ({weather.intensity:.1f})", 
-                True, (255, 255, 0)
+            self._blit_debug_line(
+                "Weather: ", f"{weather.weather_type.value} ({weather.intensity:.1f})", y_offset
             )
-            self.screen.blit(weather_text, (10, y_offset))
             
         except Exception as e:
             self.logger.error("Error rendering debug info", exception=e)
     
+    def _blit_debug_line(self, label: str, value: str, y_offset: int) -> None:
+        """Draw one debug overlay line as a cached label followed by its value"""
+        label_surface = self._render_debug_text(label)
+        self.screen.blit(label_surface, (10, y_offset))
+        self.screen.blit(self._render_debug_text(value), (10 + label_surface.get_width(), y_offset))
+    
+    def _render_debug_text(self, text: str) -> pygame.Surface:
+        """Render debug overlay text, reusing the surface for repeated strings"""
+        surface = self._debug_text_cache.get(text)
+        if surface is None:
+            if len(self._debug_text_cache) >= 512:
+                self._debug_text_cache.clear()  # Keep the cache bounded
+            surface = self._debug_font.render(text, True, (255, 255, 0)).convert_alpha()
+            self._debug_text_cache[text] = surface
+        return surface
+    
     def _update_performance_metrics(self, current_time: float) -> None:
         """Update performance tracking"""
         self.frame_count += 1
         self.total_time += self.delta_time
         
+        # Emit this frame's buffered debug events as one record
+        self.logger.drain()
+        
         # Update FPS every second
         if current_time - self.last_fps_update >= 1.0:
             self.current_fps = self.frame_count / (current_time - self.last_fps_update)
             self.frame_count = 0
             self.last_fps_update = current_time
+            
+            # Write out buffered log records
+            self.logger.flush()
+    
+    def _bind_global_keys(self) -> None:
+        """Map global keys to handlers, taking quick save/load from the control bindings"""
+        handlers = {
+            pygame.K_F12: self._toggle_debug_info,     # Debug features
+            pygame.K_F10: self._take_screenshot,       # Screenshot
+        }
+        for action, handler in (('quick_save', self._handle_quick_save),
+                                ('quick_load', self._handle_quick_load)):
+            key_code = self.config.get_key_code(action)
+            if key_code is not None:
+                handlers[key_code] = handler
+        self._global_key_handlers = handlers
+    
+    def _reload_settings(self) -> bool:
+        """Re-read the config file if it changed on disk"""
+        if not self.config.revalidate():
+            return False
+        self._bind_global_keys()
+        self.logger.info("Settings reloaded from config file")
+        return True
     
     def _handle_quick_save(self) -> None:
         """Handle quick save"""
@@ -379,8 +582,6 @@ class GameEngine:
     
     def _toggle_debug_info(self) -> None:
         """Toggle debug information display"""
-        if not hasattr(self, 'show_debug'):
-            self.show_debug = False
         self.show_debug = not self.show_debug
         self.logger.info(f"Debug info {'enabled' if self.show_debug else 'disabled'}")
     
@@ -389,11 +590,19 @@ class GameEngine:
         try:
             timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"screenshot_{timestamp}.png"
-            pygame.image.save(self.screen, filename)
-            self.logger.info(f"Screenshot saved: {filename}")
+            # Copy the frame now; PNG encoding happens on the I/O worker
+            self._io_pool.submit(self._save_screenshot, self.screen.copy(), filename)
         except Exception as e:
             self.logger.error("Failed to take screenshot", exception=e)
     
+    def _save_screenshot(self, surface: pygame.Surface, filename: str) -> None:
+        """Write a captured frame to disk (runs on the I/O worker)"""
+        try:
+            pygame.image.save(surface, filename)
+            self.logger.info(f"Screenshot saved: {filename}")
+        except Exception as e:
+            self.logger.error("Failed to save screenshot", exception=e)
+    
     def pause(self) -> None:
         """Pause the game"""
         self.time_manager.pause()
@@ -402,7 +611,7 @@ class GameEngine:
     def resume(self) -> None:
         """Resume the game"""
         self.time_manager.resume()
-        self.last_frame_time = time.time()
+        self.last_frame_time = time.perf_counter()
         self.logger.info("Game resumed")
     
     def shutdown(self) -> None:
@@ -418,6 +627,9 @@ class GameEngine:
         # Save configuration
         self.config.save_config()
         
+        # Let queued screenshots finish writing
+        self._io_pool.shutdown(wait=True)
+        
         # Close logger
         self.logger.flush()
         
@@ -425,14 +637,7 @@ class GameEngine:
     
     def get_system(self, system_name: str) -> Any:
         """Get a reference to a game system"""
-        systems = {
-            'event_manager': self.event_manager,
-            'state_manager': self.state_manager,
-            'time_manager': self.time_manager,
-            'config': self.config,
-            'logger': self.logger
-        }
-        return systems.get(system_name)
+        return self._systems.get(system_name)
     
     def get_screen(self) -> pygame.Surface:
         """Get the main screen surface"""
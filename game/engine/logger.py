@@ -4,8 +4,12 @@ Provides structured logging for debugging and monitoring
 """
 
 import logging
+import logging.handlers
 import os
 import sys
+import threading
+import time
+from collections import deque
 from datetime import datetime
 from enum import Enum
 from typing import Optional
@@ -20,30 +24,57 @@ class LogLevel(Enum):
     CRITICAL = logging.CRITICAL
 
 
+class _CategoryFilter(logging.Filter):
+    """Give records logged without a category the default one"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, 'category'):
+            record.category = "GENERAL"
+        return True
+
+
 class Logger:
     """Enhanced logging system for the game"""
     
     _instance: Optional['Logger'] = None
     _initialized: bool = False
+    _lock = threading.Lock()  # Guards first construction across threads
     
-    def __new__(cls) -> 'Logger':
+    # _initialized stays a class attribute: it is read before setup runs
+    __slots__ = ('log_file', 'level', 'logger', '_file_handler', '_debug_ring', '_debug_enabled',
+                 '_resolved_log_path')
+    
+    def __new__(cls, *args, **kwargs) -> 'Logger':
         """Singleton pattern implementation"""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
         return cls._instance
     
     def __init__(self, log_file: str = "game.log", level: LogLevel = LogLevel.INFO):
         """Initialize the logger (only once due to singleton)"""
         if self._initialized:
             return
-            
+        
+        with Logger._lock:
+            if self._initialized:
+                return  # Another thread finished setup first
+            self._setup(log_file, level)
+        self.info("Logger initialized successfully")
+    
+    def _setup(self, log_file: str, level: LogLevel) -> None:
+        """Create handlers; called once, with the construction lock held"""
         self.log_file = log_file
         self.level = level
         
-        # Create logs directory if it doesn't exist
-        log_dir = os.path.dirname(log_file) if os.path.dirname(log_file) else "logs"
-        if log_dir and not os.path.exists(log_dir):
+        # Bare file names go under logs/; paths with a directory are used as given
+        log_dir = os.path.dirname(log_file) or "logs"
+        self._resolved_log_path = os.path.join(log_dir, os.path.basename(log_file))
+        try:
             os.makedirs(log_dir, exist_ok=True)
+        except OSError:
+            pass  # FileHandler below reports the real problem
         
         # Set up the logger
         self.logger = logging.getLogger("AethermoorRPG")
@@ -53,72 +84,96 @@ class Logger:
         for handler in self.logger.handlers[:]:
             self.logger.removeHandler(handler)
         
-        # Create formatters
+        # Create formatters; the category is passed per record via extra=
         detailed_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+            '%(asctime)s - %(name)s - %(levelname)s - [%(category)s] - %(funcName)s:%(lineno)d - %(message)s'
         )
         simple_formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(message)s'
+            '%(asctime)s - %(levelname)s - [%(category)s] %(message)s'
         )
+        category_filter = _CategoryFilter()
         
         # File handler for detailed logging
-        file_handler = logging.FileHandler(
-            os.path.join(log_dir, log_file) if log_dir != "logs" else os.path.join("logs", log_file)
-        )
+        file_handler = logging.FileHandler(self._resolved_log_path)
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(detailed_formatter)
-        self.logger.addHandler(file_handler)
+        self._file_handler = file_handler
+        
+        # Buffer file records in memory; written out when the buffer fills,
+        # on errors, or when flush() is called (once per second by the engine)
+        memory_handler = logging.handlers.MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+        memory_handler.setLevel(logging.DEBUG)
+        memory_handler.addFilter(category_filter)
+        self.logger.addHandler(memory_handler)
         
         # Console handler for important messages
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(simple_formatter)
+        console_handler.addFilter(category_filter)
         self.logger.addHandler(console_handler)
         
-        self._initialized = True
-        self.info("Logger initialized successfully")
+        # High-volume debug events (combat, world) are queued here and written
+        # as one record per frame by drain()
+        self._debug_ring = deque(maxlen=8192)
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        
+        type(self)._initialized = True
     
     def debug(self, message: str, category: str = "GENERAL") -> None:
         """Log debug message"""
-        self.logger.debug(f"[{category}] {message}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(message, extra={'category': category})
     
     def info(self, message: str, category: str = "GENERAL") -> None:
         """Log info message"""
-        self.logger.info(f"[{category}] {message}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(message, extra={'category': category})
     
     def warning(self, message: str, category: str = "GENERAL") -> None:
         """Log warning message"""
-        self.logger.warning(f"[{category}] {message}")
+        self.logger.warning(message, extra={'category': category})
     
     def error(self, message: str, category: str = "GENERAL", exception: Optional[Exception] = None) -> None:
         """Log error message"""
-        error_msg = f"[{category}] {message}"
         if exception:
-            error_msg += f" - Exception: {str(exception)}"
-        self.logger.error(error_msg)
+            self.logger.error("%s - Exception: %s", message, exception, extra={'category': category})
+        else:
+            self.logger.error(message, extra={'category': category})
     
     def critical(self, message: str, category: str = "GENERAL", exception: Optional[Exception] = None) -> None:
         """Log critical message"""
-        critical_msg = f"[{category}] {message}"
         if exception:
-            critical_msg += f" - Exception: {str(exception)}"
-        self.logger.critical(critical_msg)
+            self.logger.critical("%s - Exception: %s", message, exception, extra={'category': category})
+        else:
+            self.logger.critical(message, extra={'category': category})
     
     def log_game_event(self, event_type: str, details: str) -> None:
         """Log game-specific events"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.info(f"Game Event - {event_type}: {details}", "GAME_EVENT")
     
     def log_combat(self, action: str, attacker: str, target: str = "", damage: int = 0) -> None:
         """Log combat actions"""
+        if not self._debug_enabled:
+            return
         combat_msg = f"{attacker} {action}"
         if target:
             combat_msg += f" -> {target}"
         if damage > 0:
             combat_msg += f" (Damage: {damage})"
-        self.debug(combat_msg, "COMBAT")
+        self._queue_debug("COMBAT", combat_msg)
     
     def log_quest(self, quest_name: str, action: str, details: str = "") -> None:
         """Log quest-related events"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         quest_msg = f"Quest '{quest_name}' - {action}"
         if details:
             quest_msg += f": {details}"
@@ -126,33 +181,60 @@ class Logger:
     
     def log_performance(self, function_name: str, execution_time: float) -> None:
         """Log performance metrics"""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         self.debug(f"Performance - {function_name}: {execution_time:.4f}s", "PERFORMANCE")
     
     def log_save_load(self, action: str, save_name: str, success: bool) -> None:
         """Log save/load operations"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         status = "SUCCESS" if success else "FAILED"
         self.info(f"Save/Load - {action} '{save_name}': {status}", "SAVE_LOAD")
     
     def log_world_event(self, event_type: str, location: str, details: str) -> None:
         """Log world simulation events"""
-        self.debug(f"World Event - {event_type} at {location}: {details}", "WORLD")
+        if not self._debug_enabled:
+            return
+        self._queue_debug("WORLD", f"World Event - {event_type} at {location}: {details}")
+    
+    def _queue_debug(self, category: str, message: str) -> None:
+        """Buffer a debug message until the next drain()"""
+        self._debug_ring.append((time.time(), category, message))
+    
+    def drain(self) -> None:
+        """Write all buffered debug messages as a single record"""
+        ring = self._debug_ring
+        if not ring:
+            return
+        lines = '\n'.join(f"{t:.3f} [{c}] {m}" for t, c, m in ring)
+        ring.clear()
+        self.logger.debug(lines, extra={'category': 'BATCH'})
+    
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Check whether a message at this level would be logged"""
+        return self.logger.isEnabledFor(level.value)
     
     def set_level(self, level: LogLevel) -> None:
         """Change the logging level"""
         self.level = level
         self.logger.setLevel(level.value)
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
         self.info(f"Log level changed to {level.name}")
     
     def flush(self) -> None:
         """Flush all handlers"""
+        self.drain()
         for handler in self.logger.handlers:
             handler.flush()
     
     def close(self) -> None:
         """Close all handlers"""
+        self.drain()
         for handler in self.logger.handlers:
             handler.close()
         self.logger.handlers.clear()
+        self._file_handler.close()
 
 
 # Convenience function for getting the logger instance
@@ -4,11 +4,19 @@ Manages game states and transitions between them
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, List, Any
+from array import array
+from collections import deque
+from typing import Dict, Optional, List, Any, Iterator, Tuple
 from enum import Enum
 import pygame
-from .event_manager import EventManager, EventType, emit_event
-from .logger import get_logger
+from .event_manager import EventType, emit_event, get_event_manager
+from .logger import LogLevel, get_logger
+
+
+# Pending transition op codes: transitions are queued as (op, target, data)
+_OP_CHANGE = 0
+_OP_PUSH = 1
+_OP_POP = 2
 
 
 class StateType(Enum):
@@ -33,39 +41,74 @@ class StateType(Enum):
     CREDITS = "credits"
 
 
+# Dense per-member index used to address StateManager's state table
+for _index, _state_type in enumerate(StateType):
+    _state_type.index = _index
+del _index, _state_type
+
+# State names by index, for log messages without Enum .value lookups
+_STATE_NAMES = tuple(state_type.value for state_type in StateType)
+
+
 class GameState(ABC):
     """Abstract base class for all game states"""
     
+    __slots__ = ('state_type', 'state_manager', 'logger', 'event_manager',
+                 'active', 'initialized', '_data',
+                 'can_pause', 'blocks_input', 'overlay')
+    
     def __init__(self, state_type: StateType, state_manager: 'StateManager'):
         self.state_type = state_type
         self.state_manager = state_manager
         self.logger = get_logger()
-        self.event_manager = EventManager()
+        self.event_manager = get_event_manager()
         self.active = False
         self.initialized = False
         
-        # State-specific data
-        self.data: Dict[str, Any] = {}
+        # State-specific data, created on first access (see the data property)
+        self._data: Optional[Dict[str, Any]] = None
         
         # Transition flags
         self.can_pause = True
         self.blocks_input = False
         self.overlay = False  # If True, state is rendered over previous state
     
-    @abstractmethod
+    @property
+    def data(self) -> Dict[str, Any]:
+        """State-specific data"""
+        if self._data is None:
+            self._data = {}
+        return self._data
+    
+    @data.setter
+    def data(self, value: Dict[str, Any]) -> None:
+        self._data = value
+    
     def enter(self, previous_state: Optional['GameState'] = None, 
               data: Dict[str, Any] = None) -> None:
-        """Called when entering this state"""
+        """Called when entering this state; subclasses override on_enter"""
         self.active = True
         if data:
             self.data.update(data)
-        self.logger.info(f"Entered state: {self.state_type.value}")
+        if self.logger.is_enabled_for(LogLevel.INFO):
+            self.logger.info(f"Entered state: {_STATE_NAMES[self.state_type.index]}")
+        self.on_enter(previous_state, data)
     
-    @abstractmethod
     def exit(self, next_state: Optional['GameState'] = None) -> None:
-        """Called when exiting this state"""
+        """Called when exiting this state; subclasses override on_exit"""
         self.active = False
-        self.logger.info(f"Exited state: {self.state_type.value}")
+        if self.logger.is_enabled_for(LogLevel.INFO):
+            self.logger.info(f"Exited state: {_STATE_NAMES[self.state_type.index]}")
+        self.on_exit(next_state)
+    
+    def on_enter(self, previous_state: Optional['GameState'], 
+                 data: Optional[Dict[str, Any]]) -> None:
+        """Override this for state-specific setup on entry"""
+        pass
+    
+    def on_exit(self, next_state: Optional['GameState']) -> None:
+        """Override this for state-specific teardown on exit"""
+        pass
     
     @abstractmethod
     def update(self, delta_time: float) -> None:
@@ -112,71 +155,74 @@ class StateManager:
     
     def __init__(self):
         self.logger = get_logger()
-        self.event_manager = EventManager()
+        self.event_manager = get_event_manager()
         
         # State management
         self.states: Dict[StateType, GameState] = {}
+        self._states_by_index: List[Optional[GameState]] = [None] * len(StateType)
         self.state_stack: List[GameState] = []
-        self.current_state: Optional[GameState] = None
+        self.current_state: Optional[GameState] = None  # Always the top of the stack
+        
+        # Per-frame views of the stack, rebuilt whenever it changes
+        self._render_stack: List[GameState] = []  # Bottom-most opaque state upward
+        self._input_stack: List[GameState] = []   # Top-down states not blocking input
+        self._stacked_mask = 0  # Bit n set when the StateType with index n is on the stack
+        self._stack_type_ids = array('i')  # StateType index of each stacked state, bottom first
         
         # Transition management
-        self._pending_transition: Optional[Dict[str, Any]] = None
+        self._pending_transition: Optional[Tuple[int, Optional[StateType], Optional[Dict[str, Any]]]] = None
         self._transition_data: Dict[str, Any] = {}
         
         # State history for navigation
-        self.state_history: List[StateType] = []
         self.max_history = 50
+        self.state_history: deque = deque(maxlen=self.max_history)
     
     def register_state(self, state: GameState) -> None:
         """Register a new state"""
         self.states[state.state_type] = state
+        self._states_by_index[state.state_type.index] = state
         state.initialize()
-        self.logger.debug(f"Registered state: {state.state_type.value}")
+        if self.logger.is_enabled_for(LogLevel.DEBUG):
+            self.logger.debug(f"Registered state: {_STATE_NAMES[state.state_type.index]}")
     
     def unregister_state(self, state_type: StateType) -> None:
         """Unregister a state"""
-        if state_type in self.states:
-            state = self.states[state_type]
+        state = self._states_by_index[state_type.index]
+        if state is not None:
             if state.active:
-                self.logger.warning(f"Unregistering active state: {state_type.value}")
+                self.logger.warning(f"Unregistering active state: {_STATE_NAMES[state_type.index]}")
             
             state.cleanup()
             del self.states[state_type]
-            self.logger.debug(f"Unregistered state: {state_type.value}")
+            self._states_by_index[state_type.index] = None
+            if self.logger.is_enabled_for(LogLevel.DEBUG):
+                self.logger.debug(f"Unregistered state: {_STATE_NAMES[state_type.index]}")
     
     def change_state(self, state_type: StateType, data: Dict[str, Any] = None,
                     immediate: bool = False) -> bool:
         """Change to a new state"""
-        if state_type not in self.states:
-            self.logger.error(f"State not found: {state_type.value}")
+        if self._states_by_index[state_type.index] is None:
+            self.logger.error(f"State not found: {_STATE_NAMES[state_type.index]}")
             return False
         
         if immediate:
             self._perform_state_change(state_type, data)
         else:
-            self._pending_transition = {
-                'type': 'change',
-                'target': state_type,
-                'data': data or {}
-            }
+            self._pending_transition = (_OP_CHANGE, state_type, data)
         
         return True
     
     def push_state(self, state_type: StateType, data: Dict[str, Any] = None,
                   immediate: bool = False) -> bool:
         """Push a new state onto the stack"""
-        if state_type not in self.states:
-            self.logger.error(f"State not found: {state_type.value}")
+        if self._states_by_index[state_type.index] is None:
+            self.logger.error(f"State not found: {_STATE_NAMES[state_type.index]}")
             return False
         
         if immediate:
             self._perform_state_push(state_type, data)
         else:
-            self._pending_transition = {
-                'type': 'push',
-                'target': state_type,
-                'data': data or {}
-            }
+            self._pending_transition = (_OP_PUSH, state_type, data)
         
         return True
     
@@ -189,30 +235,22 @@ class StateManager:
         if immediate:
             self._perform_state_pop()
         else:
-            self._pending_transition = {
-                'type': 'pop',
-                'target': None,
-                'data': {}
-            }
+            self._pending_transition = (_OP_POP, None, None)
         
         return True
     
     def back_to_state(self, state_type: StateType, data: Dict[str, Any] = None) -> bool:
         """Go back to a specific state in the stack"""
-        # Find the state in the stack
-        target_index = -1
-        for i, state in enumerate(self.state_stack):
-            if state.state_type == state_type:
-                target_index = i
-                break
-        
-        if target_index == -1:
-            self.logger.warning(f"State {state_type.value} not found in stack")
+        # Find the state in the stack (array.index scans in C)
+        try:
+            target_index = self._stack_type_ids.index(state_type.index)
+        except ValueError:
+            self.logger.warning(f"State {_STATE_NAMES[state_type.index]} not found in stack")
             return False
         
-        # Pop states until we reach the target
-        while len(self.state_stack) > target_index + 1:
-            self.pop_state(immediate=True)
+        # Pop everything above the target in one step
+        if target_index < len(self.state_stack) - 1:
+            self._perform_state_pop_to(target_index)
         
         # Update the target state with new data if provided
         if data and self.current_state:
@@ -222,30 +260,25 @@ class StateManager:
     
     def clear_stack(self, new_state: StateType, data: Dict[str, Any] = None) -> bool:
         """Clear the entire stack and set a new base state"""
-        if new_state not in self.states:
-            self.logger.error(f"State not found: {new_state.value}")
+        if self._states_by_index[new_state.index] is None:
+            self.logger.error(f"State not found: {_STATE_NAMES[new_state.index]}")
             return False
         
-        # Exit all current states
-        while self.state_stack:
-            state = self.state_stack.pop()
-            state.exit()
-        
-        # Set new base state
-        return self.change_state(new_state, data, immediate=True)
+        self._perform_stack_replace(new_state, data)
+        return True
     
     def update(self, delta_time: float) -> None:
         """Update the current state"""
         # Process pending transitions
-        if self._pending_transition:
-            transition = self._pending_transition
+        if self._pending_transition is not None:
+            op, target, data = self._pending_transition
             self._pending_transition = None
             
-            if transition['type'] == 'change':
-                self._perform_state_change(transition['target'], transition['data'])
-            elif transition['type'] == 'push':
-                self._perform_state_push(transition['target'], transition['data'])
-            elif transition['type'] == 'pop':
+            if op == _OP_CHANGE:
+                self._perform_state_change(target, data)
+            elif op == _OP_PUSH:
+                self._perform_state_push(target, data)
+            else:
                 self._perform_state_pop()
         
         # Update current state
@@ -254,34 +287,51 @@ class StateManager:
     
     def render(self, screen: pygame.Surface) -> None:
         """Render the current state(s)"""
-        if not self.state_stack:
-            return
-        
-        # Find the bottom-most non-overlay state
-        start_index = len(self.state_stack) - 1
-        for i in range(len(self.state_stack) - 1, -1, -1):
-            if not self.state_stack[i].overlay:
-                start_index = i
-                break
-        
         # Render states from bottom to top
-        for i in range(start_index, len(self.state_stack)):
-            state = self.state_stack[i]
+        for state in self._render_stack:
             if state.active:
                 state.render(screen)
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle pygame events"""
+        input_stack = self._input_stack
+        
+        # Common case: a single state takes input
+        if len(input_stack) == 1:
+            state = input_stack[0]
+            return state.active and bool(state.handle_event(event))
+        
         # Process events from top of stack downward
-        for state in reversed(self.state_stack):
-            if state.active and not state.blocks_input:
-                if state.handle_event(event):
-                    return True  # Event was consumed
+        for state in input_stack:
+            if state.active and state.handle_event(event):
+                return True  # Event was consumed
         return False
     
+    def _rebuild_stack_views(self) -> None:
+        """Recompute the derived stack views after a stack change"""
+        stack = self.state_stack
+        
+        # Find the bottom-most non-overlay state
+        start_index = max(len(stack) - 1, 0)
+        for i in range(len(stack) - 1, -1, -1):
+            if not stack[i].overlay:
+                start_index = i
+                break
+        
+        # New lists rather than in-place edits, so a transition made while
+        # iterating (e.g. from handle_event) never disturbs the loop
+        self._render_stack = stack[start_index:]
+        self._input_stack = [state for state in reversed(stack) if not state.blocks_input]
+        
+        stacked_mask = 0
+        for state in stack:
+            stacked_mask |= 1 << state.state_type.index
+        self._stacked_mask = stacked_mask
+        self._stack_type_ids = array('i', [state.state_type.index for state in stack])
+    
     def _perform_state_change(self, state_type: StateType, data: Dict[str, Any]) -> None:
         """Perform an immediate state change"""
-        new_state = self.states[state_type]
+        new_state = self._states_by_index[state_type.index]
         
         # Exit current state
         if self.current_state:
@@ -294,15 +344,39 @@ class StateManager:
         
         # Enter new state
         new_state.enter(data=data)
+        self._rebuild_stack_views()
         
         # Update history
         self._add_to_history(state_type)
         
-        self.logger.info(f"Changed to state: {state_type.value}")
+        if self.logger.is_enabled_for(LogLevel.INFO):
+            self.logger.info(f"Changed to state: {_STATE_NAMES[state_type.index]}")
+    
+    def _perform_stack_replace(self, state_type: StateType, data: Dict[str, Any]) -> None:
+        """Exit every stacked state and make state_type the only one"""
+        new_state = self._states_by_index[state_type.index]
+        
+        # Exit all current states, top first, once each
+        for state in reversed(self.state_stack):
+            state.exit(new_state)
+        
+        self.state_stack.clear()
+        self.state_stack.append(new_state)
+        self.current_state = new_state
+        
+        # Enter new state
+        new_state.enter(data=data)
+        self._rebuild_stack_views()
+        
+        # Update history
+        self._add_to_history(state_type)
+        
+        if self.logger.is_enabled_for(LogLevel.INFO):
+            self.logger.info(f"Changed to state: {_STATE_NAMES[state_type.index]}")
     
     def _perform_state_push(self, state_type: StateType, data: Dict[str, Any]) -> None:
         """Perform an immediate state push"""
-        new_state = self.states[state_type]
+        new_state = self._states_by_index[state_type.index]
         previous_state = self.current_state
         
         # Pause current state if it can be paused
@@ -315,11 +389,13 @@ class StateManager:
         
         # Enter new state
         new_state.enter(previous_state, data)
+        self._rebuild_stack_views()
         
         # Update history
         self._add_to_history(state_type)
         
-        self.logger.info(f"Pushed state: {state_type.value}")
+        if self.logger.is_enabled_for(LogLevel.INFO):
+            self.logger.info(f"Pushed state: {_STATE_NAMES[state_type.index]}")
     
     def _perform_state_pop(self) -> None:
         """Perform an immediate state pop"""
@@ -334,36 +410,64 @@ class StateManager:
         self.current_state = self.state_stack[-1] if self.state_stack else None
         if self.current_state:
             self.current_state.resume()
+        self._rebuild_stack_views()
+        
+        if self.logger.is_enabled_for(LogLevel.INFO):
+            self.logger.info(f"Popped state: {_STATE_NAMES[current_state.state_type.index]}")
+    
+    def _perform_state_pop_to(self, target_index: int) -> None:
+        """Pop every state above target_index, resuming only the new top"""
+        exiting = self.state_stack[target_index + 1:]
+        del self.state_stack[target_index + 1:]
+        
+        # Exit from the top down
+        for state in reversed(exiting):
+            state.exit()
+        
+        self.current_state = self.state_stack[-1]
+        self.current_state.resume()
+        self._rebuild_stack_views()
         
-        self.logger.info(f"Popped state: {current_state.state_type.value}")
+        if self.logger.is_enabled_for(LogLevel.INFO):
+            self.logger.info(f"Popped {len(exiting)} state(s) back to: {_STATE_NAMES[self.current_state.state_type.index]}")
     
     def _add_to_history(self, state_type: StateType) -> None:
         """Add state to history"""
-        self.state_history.append(state_type)
-        if len(self.state_history) > self.max_history:
-            self.state_history.pop(0)
+        self.state_history.append(state_type)  # deque drops the oldest entry
     
     def get_current_state(self) -> Optional[GameState]:
         """Get the current active state"""
         return self.current_state
     
-    def get_state_stack(self) -> List[GameState]:
-        """Get the current state stack"""
-        return self.state_stack.copy()
+    def get_state_stack(self) -> Tuple[GameState, ...]:
+        """Get the current state stack (bottom first) as a read-only tuple"""
+        return tuple(self.state_stack)
+    
+    def snapshot_state_stack(self) -> List[GameState]:
+        """Get a mutable copy of the current state stack"""
+        return list(self.state_stack)
     
     def is_state_active(self, state_type: StateType) -> bool:
         """Check if a specific state is currently active"""
-        return any(state.state_type == state_type and state.active 
-                  for state in self.state_stack)
+        # The mask only answers "stacked?"; active is read live, since it may be toggled directly
+        if not (self._stacked_mask >> state_type.index) & 1:
+            return False
+        return any(state.state_type is state_type and state.active for state in self.state_stack)
+    
+    def get_state_history(self) -> Tuple[StateType, ...]:
+        """Get the state transition history (oldest first) as a read-only tuple"""
+        return tuple(self.state_history)
     
-    def get_state_history(self) -> List[StateType]:
-        """Get the state transition history"""
-        return self.state_history.copy()
+    def iter_state_history(self) -> Iterator[StateType]:
+        """Iterate the state history (oldest first) without copying it"""
+        return iter(self.state_history)
     
     def cleanup(self) -> None:
         """Cleanup all states"""
         for state in self.states.values():
             state.cleanup()
         self.states.clear()
+        self._states_by_index = [None] * len(StateType)
         self.state_stack.clear()
-        self.current_state = None
\ No newline at end of file
+        self.current_state = None
+        self._rebuild_stack_views()
\ No newline at end of file
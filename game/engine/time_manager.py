@@ -3,12 +3,17 @@ Time Management System for Chronicles of Aethermoor
 Manages game time, day/night cycles, and temporal events
 """
 
+import heapq
+import itertools
 import time
-from typing import Dict, List, Callable, Any, Optional
+from collections import deque
+from typing import Dict, List, Callable, Any, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass
+import numpy as np
 from .event_manager import EventManager, EventType, emit_event
 from .logger import get_logger
+from ._jit import HAVE_NUMBA, maybe_njit
 
 
 class TimeOfDay(Enum):
@@ -42,7 +47,151 @@ class WeatherType(Enum):
     CRYSTAL_STORM = "crystal_storm"  # Magical weather specific to Aethermoor
 
 
-@dataclass
+# Calendar constants (total_minutes counts 365-day years)
+_MINUTES_PER_HOUR = 60
+_MINUTES_PER_DAY = 24 * _MINUTES_PER_HOUR
+_MINUTES_PER_MONTH = 30 * _MINUTES_PER_DAY
+_MINUTES_PER_YEAR = 365 * _MINUTES_PER_DAY
+
+# Real time is read in integer nanoseconds; game time is accumulated in
+# fixed point, in billionths of a game minute
+_NS_PER_SECOND = 1_000_000_000
+_MINUTE_UNITS = 1_000_000_000
+
+# Time of day for each hour 0-23
+_HOUR_TO_TIME_OF_DAY = (
+    (TimeOfDay.NIGHT,) * 2 +       # 0-1
+    (TimeOfDay.MIDNIGHT,) * 3 +    # 2-4
+    (TimeOfDay.DAWN,) * 2 +        # 5-6
+    (TimeOfDay.MORNING,) * 3 +     # 7-9
+    (TimeOfDay.MIDDAY,) * 4 +      # 10-13
+    (TimeOfDay.AFTERNOON,) * 3 +   # 14-16
+    (TimeOfDay.DUSK,) * 2 +        # 17-18
+    (TimeOfDay.EVENING,) * 3 +     # 19-21
+    (TimeOfDay.NIGHT,) * 2         # 22-23
+)
+
+# The same table as TimeOfDay indices, for compiled kernels
+_TIME_OF_DAY_ORDER = tuple(TimeOfDay)
+_HOUR_TO_TIME_OF_DAY_INDEX = np.array(
+    [_TIME_OF_DAY_ORDER.index(time_of_day) for time_of_day in _HOUR_TO_TIME_OF_DAY],
+    dtype=np.int64
+)
+
+# Bit n set when hour n is daytime (dawn through afternoon)
+_DAYTIME_HOURS = sum(
+    1 << hour for hour, time_of_day in enumerate(_HOUR_TO_TIME_OF_DAY)
+    if time_of_day in (TimeOfDay.DAWN, TimeOfDay.MORNING, TimeOfDay.MIDDAY, TimeOfDay.AFTERNOON)
+)
+
+# Season for each month 1-12, indexed by month - 1
+_MONTH_TO_SEASON = (
+    Season.WINTER, Season.WINTER,
+    Season.SPRING, Season.SPRING, Season.SPRING,
+    Season.SUMMER, Season.SUMMER, Season.SUMMER,
+    Season.AUTUMN, Season.AUTUMN, Season.AUTUMN,
+    Season.WINTER,
+)
+
+# Base light levels by time of day
+_BASE_LIGHT = {
+    TimeOfDay.MIDNIGHT: 0.1,
+    TimeOfDay.DAWN: 0.4,
+    TimeOfDay.MORNING: 0.8,
+    TimeOfDay.MIDDAY: 1.0,
+    TimeOfDay.AFTERNOON: 0.9,
+    TimeOfDay.DUSK: 0.5,
+    TimeOfDay.EVENING: 0.3,
+    TimeOfDay.NIGHT: 0.2
+}
+
+# Light multiplier by weather
+_WEATHER_LIGHT_MODIFIER = {
+    WeatherType.CLEAR: 1.0,
+    WeatherType.CLOUDY: 0.8,
+    WeatherType.RAIN: 0.7,
+    WeatherType.STORM: 0.4,
+    WeatherType.FOG: 0.5,
+    WeatherType.SNOW: 0.6,
+    WeatherType.CRYSTAL_STORM: 0.6
+}
+
+# Base ambient colors by time of day
+_BASE_AMBIENT_COLOR = {
+    TimeOfDay.MIDNIGHT: (20, 20, 40),
+    TimeOfDay.DAWN: (255, 180, 100),
+    TimeOfDay.MORNING: (255, 255, 200),
+    TimeOfDay.MIDDAY: (255, 255, 255),
+    TimeOfDay.AFTERNOON: (255, 240, 200),
+    TimeOfDay.DUSK: (255, 150, 80),
+    TimeOfDay.EVENING: (100, 100, 150),
+    TimeOfDay.NIGHT: (40, 40, 80)
+}
+
+
+def _compute_light_level(time_of_day: TimeOfDay, weather_type: WeatherType) -> float:
+    """Light level for a time of day and weather"""
+    base_light = _BASE_LIGHT.get(time_of_day, 0.5)
+    weather_modifier = _WEATHER_LIGHT_MODIFIER.get(weather_type, 1.0)
+    return max(0.05, base_light * weather_modifier)  # Minimum light level
+
+
+def _compute_ambient_color(time_of_day: TimeOfDay,
+                           weather_type: WeatherType) -> tuple[int, int, int]:
+    """Ambient color for a time of day and weather"""
+    base_color = _BASE_AMBIENT_COLOR.get(time_of_day, (255, 255, 255))
+    
+    # Weather modifications
+    if weather_type == WeatherType.STORM:
+        # Darker, more blue
+        return (
+            int(base_color[0] * 0.7),
+            int(base_color[1] * 0.7),
+            int(base_color[2] * 0.9)
+        )
+    elif weather_type == WeatherType.CRYSTAL_STORM:
+        # Purple tint
+        return (
+            int(base_color[0] * 0.8 + 50),
+            int(base_color[1] * 0.7),
+            int(base_color[2] * 0.9 + 50)
+        )
+    
+    return base_color
+
+
+# Both depend only on (time of day, weather), so every combination is computed up front
+_LIGHT_LEVELS = {
+    (time_of_day, weather_type): _compute_light_level(time_of_day, weather_type)
+    for time_of_day in TimeOfDay for weather_type in WeatherType
+}
+_AMBIENT_COLORS = {
+    (time_of_day, weather_type): _compute_ambient_color(time_of_day, weather_type)
+    for time_of_day in TimeOfDay for weather_type in WeatherType
+}
+
+# Per-weather ranges drawn on a weather change:
+# (visibility low, high, wind low, high, intensity override range or None).
+# Types not listed keep their previous visibility and wind.
+_WEATHER_RANGES = {
+    WeatherType.CLEAR: (1.0, 1.0, 0.0, 10.0, None),
+    WeatherType.RAIN: (0.6, 0.9, 10.0, 30.0, None),
+    WeatherType.STORM: (0.3, 0.6, 40.0, 80.0, None),
+    WeatherType.FOG: (0.2, 0.5, 0.0, 5.0, None),
+    WeatherType.CRYSTAL_STORM: (0.4, 0.7, 20.0, 60.0, (0.7, 1.0)),
+}
+
+# Number of random samples drawn per batch for weather changes
+_RANDOM_BATCH_SIZE = 4096
+
+# Temporal event ladder: events due within the next _EVENT_BUCKET_COUNT buckets
+# of _EVENT_BUCKET_MINUTES each wait unsorted in their bucket; only the current
+# bucket is kept in a heap. Events further out wait in an overflow heap.
+_EVENT_BUCKET_MINUTES = 60
+_EVENT_BUCKET_COUNT = 24 * 7  # One week of hourly buckets
+
+
+@dataclass(slots=True)
 class GameTime:
     """Represents a point in game time"""
     year: int = 1
@@ -54,49 +203,31 @@ class GameTime:
     def total_minutes(self) -> int:
         """Get total minutes since game start"""
         return (
-            (self.year - 1) * 365 * 24 * 60 +
-            (self.month - 1) * 30 * 24 * 60 +
-            (self.day - 1) * 24 * 60 +
-            self.hour * 60 +
+            (self.year - 1) * _MINUTES_PER_YEAR +
+            (self.month - 1) * _MINUTES_PER_MONTH +
+            (self.day - 1) * _MINUTES_PER_DAY +
+            self.hour * _MINUTES_PER_HOUR +
             self.minute
         )
     
     def get_time_of_day(self) -> TimeOfDay:
         """Get the current time of day"""
-        if 5 <= self.hour < 7:
-            return TimeOfDay.DAWN
-        elif 7 <= self.hour < 10:
-            return TimeOfDay.MORNING
-        elif 10 <= self.hour < 14:
-            return TimeOfDay.MIDDAY
-        elif 14 <= self.hour < 17:
-            return TimeOfDay.AFTERNOON
-        elif 17 <= self.hour < 19:
-            return TimeOfDay.DUSK
-        elif 19 <= self.hour < 22:
-            return TimeOfDay.EVENING
-        elif 22 <= self.hour < 24 or 0 <= self.hour < 2:
-            return TimeOfDay.NIGHT
-        else:  # 2 <= hour < 5
-            return TimeOfDay.MIDNIGHT
+        hour = self.hour
+        if 0 <= hour < 24:
+            return _HOUR_TO_TIME_OF_DAY[hour]
+        return TimeOfDay.MIDNIGHT  # Unnormalized hour
     
     def get_season(self) -> Season:
         """Get the current season"""
-        if 3 <= self.month <= 5:
-            return Season.SPRING
-        elif 6 <= self.month <= 8:
-            return Season.SUMMER
-        elif 9 <= self.month <= 11:
-            return Season.AUTUMN
-        else:  # 12, 1, 2
-            return Season.WINTER
+        month = self.month
+        if 1 <= month <= 12:
+            return _MONTH_TO_SEASON[month - 1]
+        return Season.WINTER  # Unnormalized month
     
     def is_daytime(self) -> bool:
         """Check if it's daytime"""
-        return self.get_time_of_day() in [
-            TimeOfDay.DAWN, TimeOfDay.MORNING, 
-            TimeOfDay.MIDDAY, TimeOfDay.AFTERNOON
-        ]
+        hour = self.hour
+        return 0 <= hour < 24 and (_DAYTIME_HOURS >> hour) & 1 == 1
     
     def is_nighttime(self) -> bool:
         """Check if it's nighttime"""
@@ -106,6 +237,15 @@ class GameTime:
         """Create a copy of this time"""
         return GameTime(self.year, self.month, self.day, self.hour, self.minute)
     
+    @classmethod
+    def from_total_minutes(cls, total_minutes: int) -> 'GameTime':
+        """Rebuild a time from a total_minutes() value"""
+        year_index, remainder = divmod(total_minutes, _MINUTES_PER_YEAR)
+        month_index, remainder = divmod(remainder, _MINUTES_PER_MONTH)
+        day_index, remainder = divmod(remainder, _MINUTES_PER_DAY)
+        hour, minute = divmod(remainder, _MINUTES_PER_HOUR)
+        return cls(year_index + 1, month_index + 1, day_index + 1, hour, minute)
+    
     def __str__(self) -> str:
         """String representation of time"""
         time_str = f"{self.hour:02d}:{self.minute:02d}"
@@ -113,7 +253,7 @@ class GameTime:
         return f"{time_str} - {date_str}"
 
 
-@dataclass
+@dataclass(slots=True)
 class WeatherCondition:
     """Current weather conditions"""
     weather_type: WeatherType = WeatherType.CLEAR
@@ -124,9 +264,75 @@ class WeatherCondition:
     duration_remaining: int = 0  # minutes
 
 
+@maybe_njit
+def _advance_calendar(year: int, month: int, day: int, hour: int, minute: int,
+                      minutes: int) -> tuple[int, int, int, int, int, int]:
+    """
+    Add minutes to a date, carrying overflow (30-day months, 12-month years).
+    
+    Returns the new (year, month, day, hour, minute, total_minutes).
+    """
+    extra_hours, minute = divmod(minute + minutes, 60)
+    extra_days, hour = divmod(hour + extra_hours, 24)
+    extra_months, day_index = divmod(day - 1 + extra_days, 30)
+    extra_years, month_index = divmod(month - 1 + extra_months, 12)
+    year += extra_years
+    total_minutes = (
+        (year - 1) * _MINUTES_PER_YEAR +
+        month_index * _MINUTES_PER_MONTH +
+        day_index * _MINUTES_PER_DAY +
+        hour * _MINUTES_PER_HOUR +
+        minute
+    )
+    return year, month_index + 1, day_index + 1, hour, minute, total_minutes
+
+
+def _add_minutes(game_time: GameTime, minutes: int) -> int:
+    """Advance a GameTime in place by a number of minutes; returns its total_minutes()"""
+    (game_time.year, game_time.month, game_time.day,
+     game_time.hour, game_time.minute, total_minutes) = _advance_calendar(
+        game_time.year, game_time.month, game_time.day,
+        game_time.hour, game_time.minute, minutes
+    )
+    return total_minutes
+
+
+@maybe_njit
+def _crossed_time_of_day_indices(old_hour: int, new_hour: int,
+                                 hour_table: np.ndarray) -> np.ndarray:
+    """Walk absolute hours old_hour+1..new_hour; returns the time of day indices entered"""
+    crossed = np.empty(max(new_hour - old_hour, 0), dtype=np.int64)
+    count = 0
+    current = hour_table[old_hour % 24]
+    for hour in range(old_hour + 1, new_hour + 1):
+        index = hour_table[hour % 24]
+        if index != current:
+            crossed[count] = index
+            count += 1
+            current = index
+    return crossed[:count]
+
+
+def _crossed_times_of_day(old_hour: int, old_minute: int, minutes: int) -> List[TimeOfDay]:
+    """
+    List the times of day entered, in order, when advancing from old_hour:old_minute.
+    
+    Works from the clock and the minutes advanced rather than total_minutes(),
+    whose 365-day years do not match the 360-day calendar.
+    """
+    indices = _crossed_time_of_day_indices(
+        old_hour, old_hour + (old_minute + minutes) // _MINUTES_PER_HOUR,
+        _HOUR_TO_TIME_OF_DAY_INDEX
+    )
+    return [_TIME_OF_DAY_ORDER[index] for index in indices.tolist()]
+
+
 class TemporalEvent:
     """An event that occurs at a specific time"""
     
+    __slots__ = ('event_time', 'callback', 'name', 'repeating', 'repeat_interval',
+                 'next_execution', 'pending', 'cancelled', 'done')
+    
     def __init__(self, event_time: GameTime, callback: Callable[[], None],
                  name: str = "Unnamed Event", repeating: bool = False,
                  repeat_interval: int = 0):
@@ -136,11 +342,17 @@ class TemporalEvent:
         self.repeating = repeating
         self.repeat_interval = repeat_interval  # minutes
         self.next_execution = event_time.total_minutes()
+        
+        # Queue bookkeeping: cancelled events stay queued and are skipped when due
+        self.pending = False
+        self.cancelled = False
+        self.done = False  # Set once the event will not execute again
     
     def should_execute(self, current_time: GameTime) -> bool:
         """Check if this event should execute"""
-        current_minutes = current_time.total_minutes()
-        return current_minutes >= self.next_execution
+        if self.done:
+            return False
+        return current_time.total_minutes() >= self.next_execution
     
     def execute(self, current_time: GameTime) -> None:
         """Execute the event"""
@@ -149,20 +361,21 @@ class TemporalEvent:
             if self.repeating and self.repeat_interval > 0:
                 self.next_execution = current_time.total_minutes() + self.repeat_interval
             else:
-                self.next_execution = float('inf')  # Don't execute again
+                self.done = True  # Don't execute again
         except Exception as e:
-            print(f"Error executing temporal event '{self.name}': {e}")
+            get_logger().error(f"Error executing temporal event '{self.name}'", exception=e)
 
 
 class TimeManager:
     """Manages game time, day/night cycles, and temporal events"""
     
-    def __init__(self, time_scale: float = 60.0):
+    def __init__(self, time_scale: float = 60.0, seed: Optional[int] = None):
         """
         Initialize time manager
         
         Args:
             time_scale: How many game minutes pass per real second (default: 60 = 1 hour per minute)
+            seed: Seed for weather randomness (None for a random seed)
         """
         self.logger = get_logger()
         self.event_manager = EventManager()
@@ -170,7 +383,7 @@ class TimeManager:
         # Time settings
         self.time_scale = time_scale  # Game minutes per real second
         self.paused = False
-        self.last_real_time = time.time()
+        self.last_real_ns = time.monotonic_ns()  # Monotonic, unaffected by clock changes
         
         # Game time
         self.current_time = GameTime()
@@ -187,63 +400,106 @@ class TimeManager:
             Season.WINTER: [WeatherType.SNOW, WeatherType.CLOUDY, WeatherType.CLEAR]
         }
         
-        # Temporal events
-        self.temporal_events: List[TemporalEvent] = []
-        self.completed_events: List[TemporalEvent] = []
+        # Weather randomness is drawn from pre-rolled batches
+        self._rng = np.random.default_rng(seed)
+        self._uniform_samples: List[float] = []
+        self._uniform_index = 0
+        self._duration_samples: List[int] = []
+        self._duration_index = 0
+        
+        # Temporal events, queued as (next_execution, sequence, event) entries; the
+        # sequence keeps same-minute events in scheduling order
+        self._event_sequence = itertools.count()
+        self._current_minutes = self.current_time.total_minutes()
+        self._event_slot = self._current_minutes // _EVENT_BUCKET_MINUTES
+        self._near_events: List[Tuple[int, int, TemporalEvent]] = []  # Heap, slots <= _event_slot
+        self._event_buckets: List[List[Tuple[int, int, TemporalEvent]]] = [
+            [] for _ in range(_EVENT_BUCKET_COUNT)
+        ]
+        self._far_events: List[Tuple[int, int, TemporalEvent]] = []  # Heap, beyond the ladder
+        
+        # Cancelled events stay queued until popped; compact once they dominate
+        self._queued_count = 0
+        self._cancelled_count = 0
         
-        # Performance tracking
-        self.accumulated_time = 0.0
+        # Newly scheduled events wait here until the next tick queues them;
+        # deque append/popleft are atomic, so any thread may schedule
+        self._release_queue: deque = deque()
+        self.max_completed_events = 256
+        self.completed_events: deque = deque(maxlen=self.max_completed_events)
+        
+        # Game time not yet advanced, in billionths of a game minute
+        self._accumulated_units = 0
+        
+        # Compile the calendar kernels now rather than on the first game tick
+        if HAVE_NUMBA:
+            _advance_calendar(1, 1, 1, 0, 0, 0)
+            _crossed_time_of_day_indices(0, 0, _HOUR_TO_TIME_OF_DAY_INDEX)
         
         self.logger.info("Time Manager initialized")
     
-    def update(self, delta_time: float) -> None:
-        """Update the time system"""
+    def update(self, delta_time: Optional[float] = None) -> None:
+        """Update the time system (without delta_time, the elapsed monotonic time is used)"""
         if self.paused:
             return
         
-        # Calculate time progression
-        game_minutes = delta_time * self.time_scale
-        self.accumulated_time += game_minutes
-        
-        # Only advance time in discrete minute steps
-        minutes_to_advance = int(self.accumulated_time)
+        if delta_time is None:
+            now_ns = time.monotonic_ns()
+            delta_ns = now_ns - self.last_real_ns
+            self.last_real_ns = now_ns
+            game_units = round(delta_ns * self.time_scale * _MINUTE_UNITS / _NS_PER_SECOND)
+        else:
+            game_units = round(delta_time * self.time_scale * _MINUTE_UNITS)
+        
+        # Calculate time progression in integer fixed point, only advancing in
+        # discrete minute steps
+        minutes_to_advance, self._accumulated_units = divmod(
+            self._accumulated_units + game_units, _MINUTE_UNITS
+        )
         if minutes_to_advance > 0:
-            self.accumulated_time -= minutes_to_advance
             self._advance_time(minutes_to_advance)
     
+    @property
+    def accumulated_time(self) -> float:
+        """Fraction of a game minute accumulated but not yet advanced"""
+        return self._accumulated_units / _MINUTE_UNITS
+    
+    @property
+    def last_real_time(self) -> float:
+        """Monotonic clock reading, in seconds, of the last resume or clock-driven update"""
+        return self.last_real_ns / _NS_PER_SECOND
+    
     def _advance_time(self, minutes: int) -> None:
-        """Advance game time by the specified number of minutes"""
-        old_time = self.current_time.copy()
+        """
+        Advance game time by the specified number of minutes.
         
-        # Advance minutes
-        self.current_time.minute += minutes
+        Event contract: DAY_NIGHT_CHANGED fires only when the time of day
+        changes (it no longer fires on every advance), TIME_JUMPED replaces it
+        when several times of day were crossed, and TIME_ADVANCED fires on
+        every advance. Payloads carry old_time/new_time GameTime values plus
+        old_minutes/new_minutes totals, time_of_day and season.
+        """
+        old_minutes = self._current_minutes
+        tick_listened = self.event_manager.has_listeners(EventType.TIME_ADVANCED)
         
-        # Handle minute overflow
-        while self.current_time.minute >= 60:
-            self.current_time.minute -= 60
-            self.current_time.hour += 1
-            
-            # Handle hour overflow
-            if self.current_time.hour >= 24:
-                self.current_time.hour = 0
-                self.current_time.day += 1
-                
-                # Handle day overflow
-                if self.current_time.day > 30:
-                    self.current_time.day = 1
-                    self.current_time.month += 1
-                    
-                    # Handle month overflow
-                    if self.current_time.month > 12:
-                        self.current_time.month = 1
-                        self.current_time.year += 1
+        # Advance minutes, carrying overflow up the calendar
+        old_hour = self.current_time.hour
+        old_minute = self.current_time.minute
+        current_minutes = _add_minutes(self.current_time, minutes)
+        self._current_minutes = current_minutes
         
         # Check for time of day changes
         current_time_of_day = self.current_time.get_time_of_day()
-        if current_time_of_day != self.last_time_of_day:
+        time_of_day_changed = current_time_of_day != self.last_time_of_day
+        if time_of_day_changed:
             self._on_time_of_day_changed(self.last_time_of_day, current_time_of_day)
             self.last_time_of_day = current_time_of_day
         
+        # A skip through several times of day (rest, travel) is reported as one jump
+        transitions = (_crossed_times_of_day(old_hour, old_minute, minutes)
+                       if minutes >= _MINUTES_PER_HOUR else [])
+        jumped = len(transitions) > 1
+        
         # Check for season changes
         current_season = self.current_time.get_season()
         if current_season != self.last_season:
@@ -254,15 +510,31 @@ class TimeManager:
         self._update_weather(minutes)
         
         # Process temporal events
-        self._process_temporal_events()
+        self._process_temporal_events(current_minutes)
         
-        # Emit time advancement event
-        emit_event(EventType.DAY_NIGHT_CHANGED, {
-            'old_time': old_time,
+        # A time of day change fires DAY_NIGHT_CHANGED, or TIME_JUMPED when several
+        # were crossed. TIME_ADVANCED is only built if something listens for it.
+        # The payload is built only when an event fires; the old time is rebuilt
+        # from its minute count instead of being copied on every advance.
+        if not (jumped or time_of_day_changed or tick_listened):
+            return
+        
+        data = {
+            'old_time': GameTime.from_total_minutes(old_minutes),
             'new_time': self.current_time.copy(),
+            'old_minutes': old_minutes,
+            'new_minutes': current_minutes,
             'time_of_day': current_time_of_day.value,
             'season': current_season.value
-        })
+        }
+        if jumped:
+            emit_event(EventType.TIME_JUMPED, dict(
+                data, transitions=[time_of_day.value for time_of_day in transitions]
+            ))
+        elif time_of_day_changed:
+            emit_event(EventType.DAY_NIGHT_CHANGED, dict(data) if tick_listened else data)
+        if tick_listened:
+            emit_event(EventType.TIME_ADVANCED, data)
     
     def _on_time_of_day_changed(self, old_time: TimeOfDay, new_time: TimeOfDay) -> None:
         """Handle time of day transitions"""
@@ -296,21 +568,41 @@ class TimeManager:
     
     def _update_weather(self, minutes_passed: int) -> None:
         """Update weather conditions"""
-        # Reduce remaining duration
-        if self.current_weather.duration_remaining > 0:
-            self.current_weather.duration_remaining -= minutes_passed
+        weather = self.current_weather
         
-        # Check for weather change
-        change_chance = self.weather_change_probability * minutes_passed
-        if (self.current_weather.duration_remaining <= 0 or 
-            change_chance > 0.01):  # Force change after duration or random chance
+        # Reduce remaining duration
+        remaining = weather.duration_remaining
+        if remaining > 0:
+            remaining -= minutes_passed
+            weather.duration_remaining = remaining
             
-            self._change_weather()
+            # Common case: weather continues and the step is too short to force a change
+            if remaining > 0 and self.weather_change_probability * minutes_passed <= 0.01:
+                return
+        
+        # Force change after duration or for a large enough step
+        self._change_weather()
+    
+    def _uniform(self, low: float, high: float) -> float:
+        """Draw a float in [low, high) from the pre-rolled sample batch"""
+        index = self._uniform_index
+        if index >= len(self._uniform_samples):
+            self._uniform_samples = self._rng.random(_RANDOM_BATCH_SIZE).tolist()
+            index = 0
+        self._uniform_index = index + 1
+        return low + (high - low) * self._uniform_samples[index]
+    
+    def _weather_duration(self) -> int:
+        """Draw a weather duration in minutes from the pre-rolled sample batch"""
+        index = self._duration_index
+        if index >= len(self._duration_samples):
+            self._duration_samples = self._rng.integers(30, 241, _RANDOM_BATCH_SIZE).tolist()
+            index = 0
+        self._duration_index = index + 1
+        return self._duration_samples[index]
     
     def _change_weather(self) -> None:
         """Change to new weather conditions"""
-        import random
-        
         old_weather = self.current_weather.weather_type
         current_season = self.current_time.get_season()
         
@@ -321,30 +613,21 @@ class TimeManager:
         if len(possible_weather) > 1:
             possible_weather = [w for w in possible_weather if w != old_weather]
         
-        new_weather = random.choice(possible_weather)
+        new_weather = possible_weather[int(self._uniform(0, len(possible_weather)))]
         
         # Set new weather properties
         self.current_weather.weather_type = new_weather
-        self.current_weather.intensity = random.uniform(0.3, 1.0)
-        self.current_weather.duration_remaining = random.randint(30, 240)  # 30 minutes to 4 hours
+        self.current_weather.intensity = self._uniform(0.3, 1.0)
+        self.current_weather.duration_remaining = self._weather_duration()  # 30 minutes to 4 hours
         
         # Adjust properties based on weather type
-        if new_weather == WeatherType.CLEAR:
-            self.current_weather.visibility = 1.0
-            self.current_weather.wind_speed = random.uniform(0, 10)
-        elif new_weather == WeatherType.RAIN:
-            self.current_weather.visibility = random.uniform(0.6, 0.9)
-            self.current_weather.wind_speed = random.uniform(10, 30)
-        elif new_weather == WeatherType.STORM:
-            self.current_weather.visibility = random.uniform(0.3, 0.6)
-            self.current_weather.wind_speed = random.uniform(40, 80)
-        elif new_weather == WeatherType.FOG:
-            self.current_weather.visibility = random.uniform(0.2, 0.5)
-            self.current_weather.wind_speed = random.uniform(0, 5)
-        elif new_weather == WeatherType.CRYSTAL_STORM:
-            self.current_weather.visibility = random.uniform(0.4, 0.7)
-            self.current_weather.wind_speed = random.uniform(20, 60)
-            self.current_weather.intensity = random.uniform(0.7, 1.0)
+        ranges = _WEATHER_RANGES.get(new_weather)
+        if ranges is not None:
+            visibility_low, visibility_high, wind_low, wind_high, intensity_range = ranges
+            self.current_weather.visibility = self._uniform(visibility_low, visibility_high)
+            self.current_weather.wind_speed = self._uniform(wind_low, wind_high)
+            if intensity_range is not None:
+                self.current_weather.intensity = self._uniform(*intensity_range)
         
         self.logger.log_world_event(
             "WEATHER_CHANGE",
@@ -359,29 +642,138 @@ class TimeManager:
             'visibility': self.current_weather.visibility
         })
     
-    def _process_temporal_events(self) -> None:
-        """Process scheduled temporal events"""
-        events_to_remove = []
+    def _process_temporal_events(self, current_minutes: int) -> None:
+        """Process scheduled temporal events due by current_minutes"""
+        # Queue events scheduled since the last tick
+        release_queue = self._release_queue
+        while release_queue:
+            event = release_queue.popleft()
+            if event.pending:
+                self._queued_count += 1
+                self._place_event_entry((event.next_execution, next(self._event_sequence), event))
+            else:
+                self._cancelled_count -= 1  # Cancelled before release
+        
+        if self._cancelled_count > self._queued_count // 2:
+            self._compact_event_queue()
+        
+        self._advance_event_ladder(current_minutes // _EVENT_BUCKET_MINUTES)
+        queue = self._near_events
+        rescheduled = []
+        
+        # Pop every event that is due; nothing else is touched
+        while queue and queue[0][0] <= current_minutes:
+            event = heapq.heappop(queue)[2]
+            self._queued_count -= 1
+            if not event.pending:
+                self._cancelled_count -= 1
+                continue
+            
+            # Same as event.execute(), without the per-event method call
+            try:
+                event.callback()
+            except Exception as e:
+                # A failing repeating event keeps its slot and retries next tick
+                self.logger.error(f"Error executing temporal event '{event.name}'", exception=e)
+            else:
+                if event.repeating and event.repeat_interval > 0:
+                    event.next_execution = current_minutes + event.repeat_interval
+                else:
+                    event.done = True  # Don't execute again
+            
+            if not event.pending:
+                self._cancelled_count -= 1  # Cancelled by its own callback
+                continue
+            
+            # Retire non-repeating events or completed repeating events
+            if not event.repeating or event.done:
+                event.pending = False
+                self.completed_events.append(event)
+            else:
+                rescheduled.append(event)
+        
+        # Requeue repeating events after the loop so each runs at most once per tick,
+        # dropping any that a later callback in this tick cancelled
+        for event in rescheduled:
+            if event.cancelled:
+                self._cancelled_count -= 1
+                continue
+            self._queue_event(event)
+    
+    def _queue_event(self, event: TemporalEvent) -> None:
+        """Queue an event for execution"""
+        event.pending = True
+        self._queued_count += 1
+        self._place_event_entry((event.next_execution, next(self._event_sequence), event))
+    
+    def _compact_event_queue(self) -> None:
+        """Drop cancelled entries from the near heap, buckets and overflow heap"""
+        self._near_events = [entry for entry in self._near_events if entry[2].pending]
+        heapq.heapify(self._near_events)
+        self._far_events = [entry for entry in self._far_events if entry[2].pending]
+        heapq.heapify(self._far_events)
+        buckets = self._event_buckets
+        for index, bucket in enumerate(buckets):
+            if bucket:
+                buckets[index] = [entry for entry in bucket if entry[2].pending]
+        
+        self._queued_count = len(self._near_events) + len(self._far_events) + sum(map(len, buckets))
+        self._cancelled_count = 0
+    
+    def _place_event_entry(self, entry: Tuple[int, int, TemporalEvent]) -> None:
+        """Put a queue entry in the near heap, its bucket, or the overflow heap"""
+        slot = entry[0] // _EVENT_BUCKET_MINUTES
+        if slot <= self._event_slot:
+            heapq.heappush(self._near_events, entry)
+        elif slot < self._event_slot + _EVENT_BUCKET_COUNT:
+            self._event_buckets[slot % _EVENT_BUCKET_COUNT].append(entry)
+        else:
+            heapq.heappush(self._far_events, entry)
+    
+    def _advance_event_ladder(self, target_slot: int) -> None:
+        """Move buckets up to target_slot into the near heap"""
+        slot = self._event_slot
+        if target_slot <= slot:
+            return
         
-        for event in self.temporal_events:
-            if event.should_execute(self.current_time):
-                event.execute(self.current_time)
-                
-                # Remove non-repeating events or completed repeating events
-                if not event.repeating or event.next_execution == float('inf'):
-                    events_to_remove.append(event)
-                    self.completed_events.append(event)
+        buckets = self._event_buckets
+        
+        if target_slot - slot >= _EVENT_BUCKET_COUNT:
+            # Jumped past the whole ladder: redistribute every entry
+            entries = self._near_events + self._far_events
+            for bucket in buckets:
+                entries.extend(bucket)
+            self._near_events = []
+            self._far_events = []
+            self._event_buckets = [[] for _ in range(_EVENT_BUCKET_COUNT)]
+            self._event_slot = target_slot
+            for entry in entries:
+                self._place_event_entry(entry)
+            return
         
-        # Remove completed events
-        for event in events_to_remove:
-            self.temporal_events.remove(event)
+        near = self._near_events
+        far = self._far_events
+        while slot < target_slot:
+            slot += 1
+            index = slot % _EVENT_BUCKET_COUNT
+            for entry in buckets[index]:
+                heapq.heappush(near, entry)
+            buckets[index] = []
+            
+            # The ladder now reaches one slot further; pull in overflow events
+            window_end = slot + _EVENT_BUCKET_COUNT
+            while far and far[0][0] // _EVENT_BUCKET_MINUTES < window_end:
+                entry = heapq.heappop(far)
+                buckets[(entry[0] // _EVENT_BUCKET_MINUTES) % _EVENT_BUCKET_COUNT].append(entry)
+        self._event_slot = slot
     
     def schedule_event(self, event_time: GameTime, callback: Callable[[], None],
                       name: str = "Unnamed Event", repeating: bool = False,
                       repeat_interval: int = 0) -> TemporalEvent:
         """Schedule a new temporal event"""
         event = TemporalEvent(event_time, callback, name, repeating, repeat_interval)
-        self.temporal_events.append(event)
+        event.pending = True
+        self._release_queue.append(event)
         
         self.logger.debug(f"Scheduled temporal event: {name} at {event_time}")
         return event
@@ -391,28 +783,29 @@ class TimeManager:
                                repeat_interval: int = 0) -> TemporalEvent:
         """Schedule an event relative to current time"""
         target_time = self.current_time.copy()
-        target_time.minute += minutes_from_now
-        
-        # Handle overflow
-        while target_time.minute >= 60:
-            target_time.minute -= 60
-            target_time.hour += 1
-            if target_time.hour >= 24:
-                target_time.hour = 0
-                target_time.day += 1
-                if target_time.day > 30:
-                    target_time.day = 1
-                    target_time.month += 1
-                    if target_time.month > 12:
-                        target_time.month = 1
-                        target_time.year += 1
+        _add_minutes(target_time, minutes_from_now)
         
         return self.schedule_event(target_time, callback, name, repeating, repeat_interval)
     
+    @property
+    def temporal_events(self) -> List[TemporalEvent]:
+        """Scheduled events that have not yet run out or been cancelled, in firing order"""
+        # Not yet released events come after queued ones due the same minute
+        entries = [(event.next_execution, float('inf'), event) for event in self._release_queue]
+        entries.extend(self._near_events)
+        entries.extend(self._far_events)
+        for bucket in self._event_buckets:
+            entries.extend(bucket)
+        entries.sort(key=lambda entry: entry[:2])
+        return [entry[2] for entry in entries if entry[2].pending]
+    
     def cancel_event(self, event: TemporalEvent) -> bool:
         """Cancel a scheduled event"""
-        if event in self.temporal_events:
-            self.temporal_events.remove(event)
+        if event.pending:
+            # Left in the heap and discarded when it comes due
+            event.pending = False
+            event.cancelled = True
+            self._cancelled_count += 1
             self.logger.debug(f"Cancelled temporal event: {event.name}")
             return True
         return False
@@ -425,7 +818,7 @@ class TimeManager:
     def resume(self) -> None:
         """Resume time progression"""
         self.paused = False
-        self.last_real_time = time.time()
+        self.last_real_ns = time.monotonic_ns()
         self.logger.info("Time resumed")
     
     def set_time_scale(self, scale: float) -> None:
@@ -435,13 +828,19 @@ class TimeManager:
     
     def set_time(self, game_time: GameTime) -> None:
         """Set the current game time"""
-        old_time = self.current_time.copy()
+        old_time = self.current_time  # Replaced below, so no copy is needed
+        old_minutes = self._current_minutes
         self.current_time = game_time.copy()
+        self._current_minutes = self.current_time.total_minutes()
+        self.last_time_of_day = self.current_time.get_time_of_day()
+        self.last_season = self.current_time.get_season()
         
         self.logger.info(f"Time set to {self.current_time}")
         emit_event(EventType.DAY_NIGHT_CHANGED, {
             'old_time': old_time,
             'new_time': self.current_time.copy(),
+            'old_minutes': old_minutes,
+            'new_minutes': self._current_minutes,
             'time_of_day': self.current_time.get_time_of_day().value,
             'season': self.current_time.get_season().value
         })
@@ -472,65 +871,10 @@ class TimeManager:
     
     def get_light_level(self) -> float:
         """Get current light level (0.0 = pitch black, 1.0 = full daylight)"""
-        time_of_day = self.current_time.get_time_of_day()
-        
-        # Base light levels by time of day
-        base_light = {
-            TimeOfDay.MIDNIGHT: 0.1,
-            TimeOfDay.DAWN: 0.4,
-            TimeOfDay.MORNING: 0.8,
-            TimeOfDay.MIDDAY: 1.0,
-            TimeOfDay.AFTERNOON: 0.9,
-            TimeOfDay.DUSK: 0.5,
-            TimeOfDay.EVENING: 0.3,
-            TimeOfDay.NIGHT: 0.2
-        }.get(time_of_day, 0.5)
-        
-        # Weather modifications
-        weather_modifier = {
-            WeatherType.CLEAR: 1.0,
-            WeatherType.CLOUDY: 0.8,
-            WeatherType.RAIN: 0.7,
-            WeatherType.STORM: 0.4,
-            WeatherType.FOG: 0.5,
-            WeatherType.SNOW: 0.6,
-            WeatherType.CRYSTAL_STORM: 0.6
-        }.get(self.current_weather.weather_type, 1.0)
-        
-        return max(0.05, base_light * weather_modifier)  # Minimum light level
+        return _LIGHT_LEVELS[(self.current_time.get_time_of_day(),
+                              self.current_weather.weather_type)]
     
     def get_ambient_color(self) -> tuple[int, int, int]:
         """Get ambient color based on time and weather"""
-        time_of_day = self.current_time.get_time_of_day()
-        
-        # Base colors by time of day
-        colors = {
-            TimeOfDay.MIDNIGHT: (20, 20, 40),
-            TimeOfDay.DAWN: (255, 180, 100),
-            TimeOfDay.MORNING: (255, 255, 200),
-            TimeOfDay.MIDDAY: (255, 255, 255),
-            TimeOfDay.AFTERNOON: (255, 240, 200),
-            TimeOfDay.DUSK: (255, 150, 80),
-            TimeOfDay.EVENING: (100, 100, 150),
-            TimeOfDay.NIGHT: (40, 40, 80)
-        }
-        
-        base_color = colors.get(time_of_day, (255, 255, 255))
-        
-        # Weather modifications
-        if self.current_weather.weather_type == WeatherType.STORM:
-            # Darker, more blue
-            return (
-                int(base_color[0] * 0.7),
-                int(base_color[1] * 0.7),
-                int(base_color[2] * 0.9)
-            )
-        elif self.current_weather.weather_type == WeatherType.CRYSTAL_STORM:
-            # Purple tint
-            return (
-                int(base_color[0] * 0.8 + 50),
-                int(base_color[1] * 0.7),
-                int(base_color[2] * 0.9 + 50)
-            )
-        
-        return base_color
\ No newline at end of file
+        return _AMBIENT_COLORS[(self.current_time.get_time_of_day(),
+                                self.current_weather.weather_type)]
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""
+Tests for the Configuration System
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from game.engine.config import Config
+from game.engine.event_manager import EventType, get_event_manager
+
+
+class ConfigFileCacheTests(unittest.TestCase):
+    """Parse cache keyed on file mtime and size"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "config.json")
+        self._write({'display': {'fps_limit': 60}, 'controls': {'pause': 'p'}})
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        Config._parse_cache.pop(self.path, None)
+
+    def _write(self, data, mtime_ns=None):
+        with open(self.path, 'w') as f:
+            json.dump(data, f)
+        if mtime_ns is not None:
+            os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_unchanged_file_is_parsed_once(self):
+        """A second instance reuses the cached parse of an unchanged file"""
+        first = Config(self.path)
+        cached = Config._parse_cache[self.path][1]
+        second = Config(self.path)
+
+        self.assertIs(Config._parse_cache[self.path][1], cached)
+        self.assertEqual(first.display.fps_limit, 60)
+        self.assertEqual(second.controls.pause, 'p')
+
+    def test_changed_file_is_reparsed(self):
+        """A new mtime or size invalidates the cached parse"""
+        Config(self.path)
+        self._write({'display': {'fps_limit': 144}}, mtime_ns=os.stat(self.path).st_mtime_ns + 10**9)
+
+        self.assertEqual(Config(self.path).display.fps_limit, 144)
+
+    def test_revalidate_applies_changes_once(self):
+        """revalidate reports and announces a change, then nothing until the next edit"""
+        received = []
+
+        def record(event):
+            received.append(event.data['sections'])
+
+        event_manager = get_event_manager()
+        event_manager.subscribe_callback(EventType.SETTINGS_CHANGED, record)
+        try:
+            config = Config(self.path)
+            self.assertFalse(config.revalidate())
+
+            self._write({'display': {'fps_limit': 30}}, mtime_ns=os.stat(self.path).st_mtime_ns + 10**9)
+            self.assertTrue(config.revalidate())
+            self.assertFalse(config.revalidate())
+            event_manager.process_events()
+        finally:
+            event_manager.unsubscribe_callback(EventType.SETTINGS_CHANGED, record)
+
+        self.assertEqual(config.display.fps_limit, 30)
+        self.assertEqual(received, [['display']])
+
+    def test_unparsable_file_keeps_last_good_values(self):
+        """A broken edit is ignored in favour of the values already loaded"""
+        config = Config(self.path)
+        with open(self.path, 'w') as f:
+            f.write("{ not json")
+
+        self.assertFalse(config.revalidate())
+        self.assertEqual(Config(self.path).display.fps_limit, 60)
+        self.assertEqual(config.controls.pause, 'p')
+
+
+if __name__ == '__main__':
+    unittest.main()
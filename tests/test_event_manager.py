@@ -0,0 +1,148 @@
+"""
+Tests for the Event Management System
+"""
+
+import gc
+import unittest
+
+from game.engine.event_manager import EventListener, EventType, get_event_manager
+
+
+class _RecordingListener(EventListener):
+    """Listener that records the events it receives"""
+
+    def __init__(self, received, name, priority=0):
+        super().__init__(priority)
+        self.received = received
+        self.name = name
+
+    def handle_event(self, event):
+        self.received.append((self.name, event.data.get('n')))
+        return False
+
+
+class EventDispatchTests(unittest.TestCase):
+    """Queued dispatch order and listener bookkeeping"""
+
+    def setUp(self):
+        self.event_manager = get_event_manager()
+        self.event_manager.process_events()
+        self.received = []
+        self._callbacks = []
+
+    def tearDown(self):
+        for event_type, callback in self._callbacks:
+            self.event_manager.unsubscribe_callback(event_type, callback)
+        self.event_manager.clear_queue()
+
+    def _subscribe_callback(self, event_type, callback, priority=0):
+        self.event_manager.subscribe_callback(event_type, callback, priority)
+        self._callbacks.append((event_type, callback))
+
+    def test_events_of_a_type_keep_emission_order_across_batches(self):
+        """Interleaved types are grouped per type, each in emission order"""
+        self._subscribe_callback(EventType.ITEM_USED,
+                                 lambda e: self.received.append(('used', e.data['n'])))
+        self._subscribe_callback(EventType.ITEM_SOLD,
+                                 lambda e: self.received.append(('sold', e.data['n'])))
+
+        for n in range(3):
+            self.event_manager.emit(EventType.ITEM_USED, {'n': n})
+            self.event_manager.emit(EventType.ITEM_SOLD, {'n': n})
+        self.event_manager.process_events()
+
+        self.assertEqual(self.received, [
+            ('used', 0), ('used', 1), ('used', 2),
+            ('sold', 0), ('sold', 1), ('sold', 2),
+        ])
+
+    def test_listeners_run_by_priority_then_subscription_order(self):
+        """Higher priority first; equal priorities in the order they subscribed"""
+        listeners = [
+            _RecordingListener(self.received, 'low', priority=0),
+            _RecordingListener(self.received, 'high', priority=5),
+            _RecordingListener(self.received, 'low2', priority=0),
+        ]
+        for listener in listeners:
+            self.event_manager.subscribe(EventType.ITEM_CRAFTED, listener)
+
+        self.event_manager.emit(EventType.ITEM_CRAFTED, {'n': 1})
+        self.event_manager.process_events()
+
+        self.assertEqual([name for name, _ in self.received], ['high', 'low', 'low2'])
+        for listener in listeners:
+            self.event_manager.unsubscribe(EventType.ITEM_CRAFTED, listener)
+
+    def test_listener_subscribed_mid_batch_sees_later_events(self):
+        """A subscription made while handling an event applies to the rest of the batch"""
+        def late(event):
+            self.received.append(event.data['n'])
+
+        def first(event):
+            if event.data['n'] == 0:
+                self._subscribe_callback(EventType.ITEM_EQUIPPED, late)
+
+        self._subscribe_callback(EventType.ITEM_EQUIPPED, first)
+        for n in range(3):
+            self.event_manager.emit(EventType.ITEM_EQUIPPED, {'n': n})
+        self.event_manager.process_events()
+
+        self.assertEqual(self.received, [1, 2])
+
+    def test_collected_listener_is_pruned(self):
+        """A listener dropped without unsubscribing stops receiving and counting"""
+        listener = _RecordingListener(self.received, 'gone')
+        self.event_manager.subscribe(EventType.ITEM_UNEQUIPPED, listener)
+        self.assertEqual(self.event_manager.get_listener_count(EventType.ITEM_UNEQUIPPED), 1)
+
+        del listener
+        gc.collect()
+        self.event_manager.emit(EventType.ITEM_UNEQUIPPED, {'n': 1})
+        self.event_manager.process_events()
+
+        self.assertEqual(self.received, [])
+        self.assertEqual(self.event_manager.get_listener_count(EventType.ITEM_UNEQUIPPED), 0)
+        self.assertFalse(self.event_manager.has_listeners(EventType.ITEM_UNEQUIPPED))
+
+
+class PooledEventTests(unittest.TestCase):
+    """Recycling of high-frequency event objects"""
+
+    def setUp(self):
+        self.event_manager = get_event_manager()
+        self.event_manager.process_events()
+
+    def _emit_moves(self, count, start=0):
+        for n in range(start, start + count):
+            self.event_manager.emit(EventType.PLAYER_MOVED, {'n': n})
+            self.event_manager.process_events()
+
+    def test_event_kept_by_a_listener_is_never_recycled(self):
+        """Events handed to listeners stay intact after leaving the history"""
+        kept = []
+
+        def keep(event):
+            kept.append(event)
+
+        self.event_manager.subscribe_callback(EventType.PLAYER_MOVED, keep)
+        try:
+            self._emit_moves(3)
+        finally:
+            self.event_manager.unsubscribe_callback(EventType.PLAYER_MOVED, keep)
+        self._emit_moves(1300, start=3)
+
+        self.assertEqual([event.data for event in kept], [{'n': 0}, {'n': 1}, {'n': 2}])
+        self.assertTrue(all(event.event_type is EventType.PLAYER_MOVED for event in kept))
+
+    def test_history_snapshot_is_stable(self):
+        """Lists returned by get_event_history do not change as events are recycled"""
+        self._emit_moves(5)
+        history = self.event_manager.get_event_history(EventType.PLAYER_MOVED, limit=5)
+
+        self._emit_moves(1300, start=5)
+
+        self.assertEqual([event.data['n'] for event in history], [0, 1, 2, 3, 4])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,199 @@
+"""
+Tests for the Time Management System
+"""
+
+import unittest
+
+from game.engine.event_manager import EventType, get_event_manager
+from game.engine.time_manager import GameTime, TimeManager
+
+
+class TemporalEventTests(unittest.TestCase):
+    """Scheduling and cancellation of temporal events"""
+
+    def setUp(self):
+        self.time_manager = TimeManager(seed=1)
+
+    def test_cancel_repeating_event_from_later_callback_in_same_tick(self):
+        """A repeating event cancelled by another event due the same minute stops firing"""
+        fired = []
+        repeating = self.time_manager.schedule_relative_event(
+            1, lambda: fired.append(self.time_manager._current_minutes),
+            "Repeating", repeating=True, repeat_interval=1
+        )
+        self.time_manager.schedule_relative_event(
+            1, lambda: self.time_manager.cancel_event(repeating), "Canceller"
+        )
+
+        for _ in range(5):
+            self.time_manager._advance_time(1)
+
+        self.assertEqual(len(fired), 1)
+        self.assertFalse(repeating.pending)
+        self.assertTrue(repeating.cancelled)
+        self.assertEqual(self.time_manager._cancelled_count, 0)
+
+    def test_cancel_repeating_event_from_own_callback(self):
+        """A repeating event that cancels itself is not requeued"""
+        fired = []
+
+        def callback():
+            fired.append(self.time_manager._current_minutes)
+            self.time_manager.cancel_event(repeating)
+
+        repeating = self.time_manager.schedule_relative_event(
+            1, callback, "Self cancelling", repeating=True, repeat_interval=1
+        )
+        for _ in range(5):
+            self.time_manager._advance_time(1)
+
+        self.assertEqual(len(fired), 1)
+        self.assertEqual(self.time_manager._cancelled_count, 0)
+
+
+class EventQueueTests(unittest.TestCase):
+    """Events scheduled near, within the hourly buckets, and beyond them"""
+
+    DELAYS = {
+        'near': 5,
+        'hours': 3 * 60,
+        'days': 6 * 24 * 60,      # Inside the one-week bucket window
+        'far': 10 * 24 * 60,      # Beyond it, so it migrates in later
+        'farther': 40 * 24 * 60,
+    }
+
+    def setUp(self):
+        self.time_manager = TimeManager(seed=1)
+        self.start = self.time_manager.get_time().total_minutes()
+        self.fired = []
+        self.events = {
+            name: self.time_manager.schedule_relative_event(delay, self._recorder(name), name)
+            for name, delay in self.DELAYS.items()
+        }
+
+    def _recorder(self, name):
+        def record():
+            self.fired.append((name, self.time_manager.get_time().total_minutes() - self.start))
+        return record
+
+    def _run_minutes(self, minutes, step):
+        for _ in range(minutes // step):
+            self.time_manager.update(step / self.time_manager.time_scale)
+
+    def test_events_fire_in_their_due_step(self):
+        """Each event fires once, in order, in the step that reaches its time"""
+        self._run_minutes(41 * 24 * 60, step=30)
+
+        self.assertEqual([name for name, _ in self.fired], list(self.DELAYS))
+        for name, fired_at in self.fired:
+            self.assertGreaterEqual(fired_at, self.DELAYS[name])
+            self.assertLess(fired_at, self.DELAYS[name] + 30)
+        self.assertEqual(self.time_manager.temporal_events, [])
+
+    def test_single_long_jump_fires_everything_due(self):
+        """One update across all the buckets fires every due event once, in order"""
+        self._run_minutes(20 * 24 * 60, step=20 * 24 * 60)
+
+        self.assertEqual([name for name, _ in self.fired], ['near', 'hours', 'days', 'far'])
+        self.assertEqual(self.time_manager.temporal_events, [self.events['farther']])
+
+    def test_pending_events_are_listed_in_firing_order(self):
+        """temporal_events lists pending events soonest first, without cancelled ones"""
+        self.time_manager.cancel_event(self.events['hours'])
+        self._run_minutes(60, step=60)
+
+        self.assertEqual(
+            [event.name for event in self.time_manager.temporal_events],
+            ['days', 'far', 'farther']
+        )
+
+    def test_repeating_event_follows_its_interval(self):
+        """A repeating event fires every interval until cancelled"""
+        fired = []
+        repeating = self.time_manager.schedule_relative_event(
+            90, lambda: fired.append(self.time_manager.get_time().total_minutes() - self.start),
+            "Repeating", repeating=True, repeat_interval=120
+        )
+        self._run_minutes(8 * 60, step=1)
+        self.time_manager.cancel_event(repeating)
+        self._run_minutes(8 * 60, step=1)
+
+        self.assertEqual(fired, [90, 210, 330, 450])
+
+
+class TimeProgressionTests(unittest.TestCase):
+    """Conversion of real time into game minutes"""
+
+    def test_small_steps_add_up_to_whole_minutes(self):
+        """Many short frames advance exactly as far as one long one"""
+        time_manager = TimeManager(seed=1)
+        start = time_manager.get_time().total_minutes()
+
+        for _ in range(600):
+            time_manager.update(1 / 600)
+
+        self.assertEqual(time_manager.get_time().total_minutes() - start, 60)
+        self.assertEqual(time_manager.accumulated_time, 0.0)
+
+    def test_paused_time_does_not_advance(self):
+        """Updates while paused leave the clock alone"""
+        time_manager = TimeManager(seed=1)
+        start = str(time_manager.get_time())
+
+        time_manager.pause()
+        time_manager.update(10.0)
+
+        self.assertEqual(str(time_manager.get_time()), start)
+
+
+class TimeAdvanceEventTests(unittest.TestCase):
+    """Events emitted while game time advances"""
+
+    def setUp(self):
+        self.event_manager = get_event_manager()
+        self.event_manager.process_events()
+        self.received = []
+        self.event_manager.subscribe_callback(EventType.TIME_JUMPED, self._record)
+        self.event_manager.subscribe_callback(EventType.DAY_NIGHT_CHANGED, self._record)
+        self.time_manager = TimeManager(seed=1)
+
+    def tearDown(self):
+        self.event_manager.unsubscribe_callback(EventType.TIME_JUMPED, self._record)
+        self.event_manager.unsubscribe_callback(EventType.DAY_NIGHT_CHANGED, self._record)
+
+    def _record(self, event):
+        self.received.append(event)
+        return False
+
+    def _advance(self, minutes):
+        self.time_manager.update(minutes / self.time_manager.time_scale)
+        self.event_manager.process_events()
+
+    def test_year_rollover_is_not_a_jump(self):
+        """Two hours across new year stay in NIGHT and report no transitions"""
+        self.time_manager.set_time(GameTime(1, 12, 30, 23, 0))
+        self.event_manager.process_events()
+        self.received.clear()
+
+        self._advance(120)
+
+        self.assertEqual(str(self.time_manager.get_time()), str(GameTime(2, 1, 1, 1, 0)))
+        self.assertEqual(self.received, [])
+
+    def test_skip_through_several_times_of_day_emits_one_jump(self):
+        """A long skip is reported once, with every time of day entered"""
+        self.time_manager.set_time(GameTime(1, 12, 30, 20, 0))
+        self.event_manager.process_events()
+        self.received.clear()
+
+        self._advance(10 * 60)
+
+        jumps = [e for e in self.received if e.event_type is EventType.TIME_JUMPED]
+        self.assertEqual(len(jumps), 1)
+        self.assertEqual(jumps[0].data['transitions'], ['night', 'midnight', 'dawn'])
+        self.assertEqual(jumps[0].data['old_time'].hour, 20)
+        self.assertEqual(jumps[0].data['new_time'].year, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()